@@ -1,6 +1,6 @@
 """Batch processing endpoints for folder uploads with intelligent routing."""
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, BackgroundTasks, Query
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 import os
 import asyncio
@@ -8,15 +8,16 @@ import logging
 import uuid
 import shutil
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from datetime import datetime
 import zipfile
 import io
 import tempfile
 
 from core.database import get_db
+from api.responses import model_response
 from services.model_router import ModelRouter
-from schemas.batch import BatchScanRequest, BatchScanResult, BatchProgress
+from schemas.batch import BatchScanRequest, BatchScanResult, BatchProgress, BatchImageResult
 
 logger = logging.getLogger(__name__)
 
@@ -106,7 +107,8 @@ async def batch_scan(
             'results': [],
             'start_time': datetime.now(),
             'image_paths': image_paths,
-            'job_dir': job_dir
+            'job_dir': job_dir,
+            'listeners': [],  # asyncio.Queue per open progress stream
         }
 
         # Start background processing
@@ -125,62 +127,118 @@ async def batch_scan(
 
 
 @router.get("/batch-progress/{job_id}", response_model=BatchProgress)
-async def get_batch_progress(job_id: str) -> BatchProgress:
+async def get_batch_progress(
+    job_id: str,
+    results_limit: Optional[int] = Query(None, ge=1, description="Only return the last N results"),
+):
     """
     Get progress of a batch processing job.
+
+    Polled while a batch runs; the progress model is built without
+    validation (``results`` is a list of free-form dicts) and serialized
+    directly.
     """
     if job_id not in batch_jobs:
         raise HTTPException(status_code=404, detail="Batch job not found")
 
     job = batch_jobs[job_id]
 
-    return BatchProgress(
+    return model_response(BatchProgress.model_construct(
         job_id=job_id,
         status=job['status'],
         progress_percentage=(job['processed_images'] / job['total_images']) * 100 if job['total_images'] > 0 else 0,
         processed_images=job['processed_images'],
         total_images=job['total_images'],
-        results=job['results'] if job['status'] == 'completed' else None,
+        results=(job['results'][-results_limit:] if results_limit else job['results'])
+        if job['status'] == 'completed' else None,
         estimated_time_remaining=calculate_eta(job)
-    )
+    ))
+
+
+@router.get("/batch/{job_id}/progress/stream")
+async def stream_batch_progress(job_id: str):
+    """
+    Stream per-image results of a batch job as NDJSON.
+
+    Results already finished are replayed first, then each new result is
+    written as soon as the worker produces it. The stream ends when the
+    job completes or fails.
+    """
+    if job_id not in batch_jobs:
+        raise HTTPException(status_code=404, detail="Batch job not found")
+
+    job = batch_jobs[job_id]
+
+    async def gen() -> AsyncIterator[bytes]:
+        # Snapshot and subscribe without awaiting in between so no result
+        # is missed or sent twice.
+        backlog = list(job['results'])
+        queue: Optional[asyncio.Queue] = None
+        if job['status'] == 'processing':
+            queue = asyncio.Queue()
+            job['listeners'].append(queue)
+        try:
+            for result in backlog:
+                yield _encode_result_line(result)
+            while queue is not None:
+                result = await queue.get()
+                if result is None:
+                    break
+                yield _encode_result_line(result)
+        finally:
+            if queue is not None and queue in job['listeners']:
+                job['listeners'].remove(queue)
+
+    return StreamingResponse(gen(), media_type="application/x-ndjson")
+
+
+def _encode_result_line(result: Dict[str, Any]) -> bytes:
+    """Encode one batch image result as an NDJSON line."""
+    return BatchImageResult.model_construct(**result).model_dump_json().encode() + b"\n"
+
+
+def _notify_listeners(job: Dict[str, Any], result: Optional[Dict[str, Any]]) -> None:
+    """Push a result (or the ``None`` end marker) to every open progress stream."""
+    for queue in job['listeners']:
+        queue.put_nowait(result)
 
 
 async def process_batch_job(job_id: str):
     """
     Background task to process batch images.
     """
+    job = batch_jobs.get(job_id)
     try:
-        job = batch_jobs[job_id]
         image_paths = job['image_paths']
 
         # Initialize model router
         router = ModelRouter()
 
-        # Process images in batch
-        results = await router.process_batch([str(path) for path in image_paths])
-
-        # Update image paths in results to be relative for API serving
-        for result in results:
+        # Process images one by one so progress streams see each result
+        async for result in router.iter_batch([str(path) for path in image_paths]):
             # Convert absolute path to job_id/filename format for API
             path = Path(result['image_path'])
             result['image_path'] = f"{job_id}/{path.name}"
 
-        # Update job with results
-        job['results'] = results
-        job['processed_images'] = len(results)
+            job['results'].append(result)
+            job['processed_images'] = len(job['results'])
+            _notify_listeners(job, result)
+
         job['status'] = 'completed'
 
         # Don't delete files - keep them for viewing
         # Files in scanned_images/batch/{job_id}/ will persist
 
-        logger.info(f"Batch job {job_id} completed: {len(results)} images processed")
+        logger.info(f"Batch job {job_id} completed: {len(job['results'])} images processed")
 
     except Exception as e:
         logger.error(f"Batch job {job_id} failed: {e}")
-        job = batch_jobs.get(job_id)
         if job:
             job['status'] = 'failed'
             job['error'] = str(e)
+    finally:
+        if job:
+            _notify_listeners(job, None)
 
 
 def calculate_eta(job: Dict[str, Any]) -> Optional[float]:
@@ -201,6 +259,10 @@ def calculate_eta(job: Dict[str, Any]) -> Optional[float]:
 async def get_batch_image(job_id: str, filename: str):
     """
     Serve an image from a batch job.
+
+    FileResponse answers ``Range`` requests itself (206 + Content-Range,
+    sent with sendfile where available), so viewers can resume or fetch
+    partial content of large scans.
     """
     # Security: validate job_id format (UUID)
     try:
@@ -217,7 +279,11 @@ async def get_batch_image(job_id: str, filename: str):
     except ValueError:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    if not image_path.exists():
+    # One stat for both the existence check and the response headers,
+    # off the event loop so a slow disk does not stall other requests
+    try:
+        stat_result = await asyncio.to_thread(image_path.stat)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Image not found")
     
     # Determine media type
@@ -230,4 +296,4 @@ async def get_batch_image(job_id: str, filename: str):
     }
     media_type = media_types.get(suffix, 'application/octet-stream')
     
-    return FileResponse(image_path, media_type=media_type)
\ No newline at end of file
+    return FileResponse(image_path, media_type=media_type, stat_result=stat_result)
\ No newline at end of file
@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
 from core.database import get_db
+from api.responses import model_response
 from services import DashboardService
 from schemas import DashboardStats
 
@@ -28,5 +29,5 @@ async def get_dashboard_stats(
     - Recent counterfeits
     """
     stats = await DashboardService.get_stats(db)
-    return stats
+    return model_response(stats)
 
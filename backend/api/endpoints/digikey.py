@@ -14,6 +14,7 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from pathlib import Path
 from typing import List, Optional, Dict, Any
+import asyncio
 import logging
 import re
 import json
@@ -58,7 +59,7 @@ class ICVariant(BaseModel):
     dimension_length: Optional[float] = None
     dimension_width: Optional[float] = None
     dimension_height: Optional[float] = None
-    electrical_specs: Dict[str, Any] = {}
+    electrical_specs: Dict[str, Any] = Field(default_factory=dict)
 
 
 class DigiKeySearchResponse(BaseModel):
@@ -533,7 +534,7 @@ async def parse_local_pdf(
     """
     pdf_path = Path(request.pdf_path)
 
-    if not pdf_path.exists():
+    if not await asyncio.to_thread(pdf_path.exists):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"PDF file not found: {request.pdf_path}"
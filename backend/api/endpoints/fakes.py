@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
 from core.database import get_db
+from api.responses import model_response
 from services import FakeService
 from schemas import (
     FakeListResult,
@@ -26,7 +27,7 @@ async def list_fakes(
     """
     items, total_count = await FakeService.list_fakes(db)
     
-    return FakeListResult(
+    return model_response(FakeListResult(
         fake_ics=[
             FakeRegistryItem(
                 part_number=item.part_number,
@@ -40,7 +41,7 @@ async def list_fakes(
             for item in items
         ],
         total_count=total_count,
-    )
+    ))
 
 
 @router.post("/mark", response_model=FakeRegistryItem)
@@ -60,7 +61,7 @@ async def mark_as_fake(
             reported_by=request.reported_by,
         )
         
-        return FakeRegistryItem(
+        return model_response(FakeRegistryItem(
             part_number=fake_entry.part_number,
             source=fake_entry.source,
             reason=fake_entry.reason,
@@ -68,7 +69,7 @@ async def mark_as_fake(
             added_at=fake_entry.added_at,
             scrape_attempts=fake_entry.scrape_attempts,
             manufacturers_checked=fake_entry.manufacturers_checked,
-        )
+        ))
     except ValueError as e:
         raise HTTPException(
             status_code=409,
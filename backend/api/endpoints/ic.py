@@ -3,12 +3,14 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
+import asyncio
 import logging
 
 from core.database import get_db
+from api.responses import model_response
 from services import ICService
 from services.datasheet_storage import get_datasheet_path
-from schemas import ICSpecificationResponse, ICSearchResult
+from schemas import ICSpecificationResponse, ICSearchResult, fast_from_orm
 
 logger = logging.getLogger(__name__)
 
@@ -33,24 +35,11 @@ async def get_ic_details(
             }
         )
 
-    return ICSpecificationResponse(
-        part_number=ic.part_number,
-        manufacturer=ic.manufacturer,
-        pin_count=ic.pin_count,
-        package_type=ic.package_type,
-        description=ic.description,
-        datasheet_url=ic.datasheet_url,
-        datasheet_path=ic.datasheet_path,
+    return model_response(fast_from_orm(
+        ICSpecificationResponse,
+        ic,
         has_datasheet=bool(ic.datasheet_path),
-        voltage_min=ic.voltage_min,
-        voltage_max=ic.voltage_max,
-        operating_temp_min=ic.operating_temp_min,
-        operating_temp_max=ic.operating_temp_max,
-        electrical_specs=ic.electrical_specs,
-        source=ic.source,
-        created_at=ic.created_at,
-        updated_at=ic.updated_at,
-    )
+    ))
 
 
 @router.get("/datasheet")
@@ -99,7 +88,9 @@ async def get_ic_datasheet(
             }
         )
 
-    if not datasheet_path.exists():
+    try:
+        stat_result = await asyncio.to_thread(datasheet_path.stat)
+    except FileNotFoundError:
         logger.warning(f"Datasheet file NOT FOUND at {datasheet_path} for {part_number} (DB value: {ic.datasheet_path})")
         raise HTTPException(
             status_code=404,
@@ -115,6 +106,7 @@ async def get_ic_datasheet(
         path=datasheet_path,
         media_type="application/pdf",
         filename=f"{part_number}.pdf",
+        stat_result=stat_result,
     )
 
 
@@ -4,15 +4,20 @@ Handles image upload and preprocessing operations.
 """
 from fastapi import APIRouter, UploadFile, File, HTTPException, Form, status
 from fastapi.responses import JSONResponse
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime
+from collections import OrderedDict
+from pathlib import Path
+import asyncio
+import hashlib
 import logging
 
 from schemas.images import (
     ImageUploadResponse,
     ImageUploadRequest,
     PreprocessingMetadata,
-    ErrorResponse
+    ErrorResponse,
+    IMAGE_UPLOAD_RESPONSE_EXAMPLE,
 )
 from services.storage import save_image_file
 from services.preprocessing import ImagePreprocessingPipeline, PreprocessingException
@@ -34,6 +39,32 @@ router = APIRouter(
 # Initialize preprocessing pipeline
 preprocessing_pipeline = ImagePreprocessingPipeline()
 
+# Recent uploads keyed by (content digest, preprocessing options) so an
+# identical re-upload returns the earlier result instead of re-running the
+# pipeline. Bounded LRU, per process.
+UPLOAD_CACHE_MAX_ENTRIES = 256
+_upload_cache: "OrderedDict[Tuple[str, Tuple[bool, ...]], ImageUploadResponse]" = OrderedDict()
+
+
+async def _get_cached_upload(key: Tuple[str, Tuple[bool, ...]]) -> Optional[ImageUploadResponse]:
+    """Return the cached response for an upload if its stored file still exists."""
+    cached = _upload_cache.get(key)
+    if cached is None:
+        return None
+    if not await asyncio.to_thread(Path(cached.file_path).exists):
+        _upload_cache.pop(key, None)
+        return None
+    _upload_cache.move_to_end(key)
+    return cached
+
+
+def _cache_upload(key: Tuple[str, Tuple[bool, ...]], response: ImageUploadResponse) -> None:
+    """Remember an upload response, evicting the least recently used entry."""
+    _upload_cache[key] = response
+    _upload_cache.move_to_end(key)
+    if len(_upload_cache) > UPLOAD_CACHE_MAX_ENTRIES:
+        _upload_cache.popitem(last=False)
+
 
 @router.post(
     "/upload",
@@ -52,7 +83,8 @@ preprocessing_pipeline = ImagePreprocessingPipeline()
     responses={
         201: {
             "description": "Image uploaded and preprocessed successfully",
-            "model": ImageUploadResponse
+            "model": ImageUploadResponse,
+            "content": {"application/json": {"example": IMAGE_UPLOAD_RESPONSE_EXAMPLE}},
         }
     }
 )
@@ -157,6 +189,14 @@ async def upload_image(
         
         logger.info(f"Processing upload: {file.filename} ({file_size} bytes, {file.content_type})")
         
+        # Identical bytes with identical options give an identical result
+        content_digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        cache_key = (content_digest, (denoise, enhance_contrast, normalize, edge_prep))
+        cached_response = await _get_cached_upload(cache_key)
+        if cached_response is not None:
+            logger.info(f"Duplicate upload {file.filename}, reusing image {cached_response.image_id}")
+            return cached_response
+        
         # Save the image file
         try:
             image_id, file_path = save_image_file(content, file.filename)
@@ -224,6 +264,7 @@ async def upload_image(
             uploaded_at=uploaded_at.isoformat()
         )
         
+        _cache_upload(cache_key, response)
         logger.info(f"Successfully processed image upload: {image_id}")
         return response
         
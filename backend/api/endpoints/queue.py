@@ -5,6 +5,7 @@ from typing import Optional, List
 import logging
 
 from core.database import get_db
+from api.responses import model_response
 from services import QueueService
 from schemas import QueueListResult, QueueItem, SuccessResponse, QueueAddRequest, QueueAddResponse
 
@@ -35,7 +36,7 @@ async def list_queue(
         offset=offset,
     )
     
-    return QueueListResult(
+    return model_response(QueueListResult(
         queue_items=[
             QueueItem(
                 part_number=item.part_number,
@@ -53,7 +54,7 @@ async def list_queue(
         failed_count=failed_count,
         limit=limit,
         offset=offset,
-    )
+    ))
 
 
 @router.post("/add", response_model=QueueAddResponse)
@@ -89,7 +90,7 @@ async def add_to_queue(
         added_count=added_count,
         already_queued_count=already_queued,
         message=f"Added {added_count} new items to queue, updated {already_queued} existing items.",
-        queued_items=queued_items,
+        queued_items=tuple(queued_items),
     )
 
 
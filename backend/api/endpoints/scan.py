@@ -24,12 +24,18 @@ from schemas.scan_verify import (
     ScanVerifyResult,
     ScanStatus,
     ActionRequired,
+    SCAN_EXTRACT_RESULT_EXAMPLE,
+    SCAN_VERIFY_RESULT_EXAMPLE,
 )
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["Core Inspection"])
 
+# OpenAPI examples for the scan responses
+_EXTRACT_RESPONSES = {200: {"content": {"application/json": {"example": SCAN_EXTRACT_RESULT_EXAMPLE}}}}
+_VERIFY_RESPONSES = {200: {"content": {"application/json": {"example": SCAN_VERIFY_RESULT_EXAMPLE}}}}
+
 # Maximum number of adjacent lines to combine when generating candidates
 MAX_ADJACENT_LINES = 4
 
@@ -144,7 +150,7 @@ def _parse_pin_count(raw_pin_count) -> int:
         return 0
 
 
-@router.post("/scan", response_model=ScanExtractResult)
+@router.post("/scan", response_model=ScanExtractResult, responses=_EXTRACT_RESPONSES)
 async def scan_image(
     file: UploadFile = File(...),
     bottom_file: UploadFile = File(None),
@@ -286,6 +292,10 @@ async def scan_image(
             combined_ocr_text = f"{top_ocr_text}\n--- BOTTOM VIEW ---\n{bottom_ocr_text}"
             combined_avg_confidence = max(top_avg_confidence, bottom_avg_confidence)
 
+    # OCR confidence is only meaningful to 0.1%; round it before it is stored
+    # and returned (/scan/verify rounds its score the same way)
+    combined_avg_confidence = round(combined_avg_confidence, 1)
+
     # ========== Generate Part Number Candidates ==========
     ocr_lines = [r.text.strip() for r in ocr_response.results if r.text.strip()]
     if bottom_ocr_response and bottom_ocr_response.status != "error":
@@ -427,7 +437,7 @@ async def scan_image(
 
 
 
-@router.post("/scan/verify", response_model=ScanVerifyResult)
+@router.post("/scan/verify", response_model=ScanVerifyResult, responses=_VERIFY_RESPONSES)
 async def verify_ic(
     request: ScanVerifyRequest,
     db: AsyncSession = Depends(get_db),
@@ -482,7 +492,7 @@ async def verify_ic(
     return verify_result
 
 
-@router.post("/scan/{scan_id}/bottom", response_model=ScanExtractResult)
+@router.post("/scan/{scan_id}/bottom", response_model=ScanExtractResult, responses=_EXTRACT_RESPONSES)
 async def scan_bottom_image(
     scan_id: UUID,
     file: UploadFile = File(...),
@@ -553,7 +563,7 @@ async def scan_bottom_image(
         confidence_score=scan.confidence_score,
         ocr_text=scan.ocr_text_raw or "",
         part_number_detected=scan.part_number_detected or "",
-        part_number_candidates=scan.part_number_candidates or [],
+        part_number_candidates=scan.part_number_candidates or (),
         manufacturer_detected=scan.manufacturer_detected,
         detected_pins=detected_pins,
         message="Bottom scan complete. Ready for verification.",
@@ -561,7 +571,7 @@ async def scan_bottom_image(
     )
 
 
-@router.post("/scan/override", response_model=ScanExtractResult)
+@router.post("/scan/override", response_model=ScanExtractResult, responses=_EXTRACT_RESPONSES)
 async def manual_override(
     request: dict,
     db: AsyncSession = Depends(get_db),
@@ -601,7 +611,7 @@ async def manual_override(
         confidence_score=scan.confidence_score,
         ocr_text=scan.ocr_text_raw or "",
         part_number_detected=manual_part_number,
-        part_number_candidates=scan.part_number_candidates or [],
+        part_number_candidates=scan.part_number_candidates or (),
         manufacturer_detected=scan.manufacturer_detected,
         detected_pins=scan.detected_pins,
         message="Part number corrected. Ready for verification.",
@@ -609,7 +619,7 @@ async def manual_override(
     )
 
 
-@router.post("/scan/verify", response_model=ScanVerifyResult)
+@router.post("/scan/verify", response_model=ScanVerifyResult, responses=_VERIFY_RESPONSES)
 async def verify_scan(
     request: ScanVerifyRequest,
     db: AsyncSession = Depends(get_db),
@@ -662,10 +672,17 @@ async def verify_scan(
     # Update scan record with verification results
     scan.verification_status = verification_result.verification_status.value
     scan.action_required = verification_result.action_required.value
-    scan.confidence_score = verification_result.confidence_score
+    # Stored to 0.1%, like the OCR confidence written by /scan
+    scan.confidence_score = round(verification_result.confidence_score, 1)
     scan.verified_at = verification_result.completed_at
-    scan.matched_ic_data = verification_result.matched_ic
-    scan.verification_checks = verification_result.verification_checks
+    scan.matched_ic_data = (
+        verification_result.matched_ic.model_dump() if verification_result.matched_ic else None
+    )
+    scan.verification_checks = {
+        name: check.model_dump()
+        for name, check in verification_result.verification_checks
+        if check is not None
+    }
 
     await db.flush()
     await db.refresh(scan)
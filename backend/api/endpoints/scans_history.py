@@ -1,14 +1,17 @@
 """Scan History endpoints - Audit trail operations."""
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from typing import Optional
 from datetime import datetime
 from uuid import UUID
+from urllib.parse import quote
 import logging
 import json
 
 from core.database import get_db
+from api.responses import model_response, dump_json
 from services import ScanService, ICService
 from models import ScanHistory
 from schemas import (
@@ -17,6 +20,9 @@ from schemas import (
     ScanDetails,
     ScanStatus,
     ActionRequired,
+    MatchDetails,
+    ICSpecificationResponse,
+    fast_from_orm,
 )
 from pydantic import BaseModel
 
@@ -88,6 +94,61 @@ class AnalyticsResponse(BaseModel):
     hourly_activity: dict[int, int]  # Hour -> count
 
 
+def _parse_json_field(value):
+    """Parse JSON field if it's a string, otherwise return as-is."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            return None
+    return value
+
+
+def _to_list_item(scan: ScanHistory) -> ScanListItem:
+    """
+    Build a list row from a ScanHistory record.
+
+    Status columns are passed as raw strings: the dataclass validator maps
+    them onto the enum members far cheaper than calling ScanStatus(...) here.
+    """
+    return ScanListItem(
+        scan_id=scan.scan_id,
+        part_number=scan.part_number_verified or scan.part_number_detected,
+        part_number_detected=scan.part_number_detected,
+        part_number_candidates=_parse_json_field(scan.part_number_candidates),
+        part_number_verified=scan.part_number_verified,
+        status=scan.status,
+        action_required=scan.action_required or ActionRequired.NONE,
+        confidence_score=scan.confidence_score,
+        detected_pins=scan.detected_pins,
+        expected_pins=scan.expected_pins,
+        has_bottom_scan=scan.has_bottom_scan,
+        was_manual_override=scan.was_manual_override,
+        manufacturer_detected=scan.manufacturer_detected,
+        message=scan.message,
+        scanned_at=scan.scanned_at,
+        completed_at=scan.completed_at,
+        batch_id=scan.batch_id,
+        batch_vender=scan.batch_vender,
+    )
+
+
+def _validate_list_filters(status: Optional[str], action_required: Optional[str]) -> None:
+    """Reject unknown status / action_required filter values."""
+    if status and status not in [s.value for s in ScanStatus]:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid status. Must be one of: {[s.value for s in ScanStatus]}"
+        )
+    if action_required and action_required not in [a.value for a in ActionRequired]:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid action_required. Must be one of: {[a.value for a in ActionRequired]}"
+        )
+
+
 @router.get("/list", response_model=ScanListResult)
 async def list_scans(
     status: Optional[str] = Query(None, description="Filter by status"),
@@ -107,17 +168,7 @@ async def list_scans(
     """
     List all scans with optional filters.
     """
-    # Validate status if provided
-    if status and status not in [s.value for s in ScanStatus]:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid status. Must be one of: {[s.value for s in ScanStatus]}"
-        )
-    if action_required and action_required not in [a.value for a in ActionRequired]:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid action_required. Must be one of: {[a.value for a in ActionRequired]}"
-        )
+    _validate_list_filters(status, action_required)
     
     scans, total_count = await ScanService.list_scans(
         db=db,
@@ -135,46 +186,72 @@ async def list_scans(
         offset=offset,
     )
     
-    def parse_json_field(value):
-        """Parse JSON field if it's a string, otherwise return as-is."""
-        if value is None:
-            return None
-        if isinstance(value, str):
-            try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                return None
-        return value
-    
-    return ScanListResult(
+    return model_response(ScanListResult(
         scans=[
-            ScanListItem(
-                scan_id=scan.scan_id,
-                part_number=scan.part_number_verified or scan.part_number_detected,
-                part_number_detected=scan.part_number_detected,
-                part_number_candidates=parse_json_field(scan.part_number_candidates),
-                part_number_verified=scan.part_number_verified,
-                status=ScanStatus(scan.status),
-                action_required=ActionRequired(scan.action_required) if scan.action_required else ActionRequired.NONE,
-                confidence_score=scan.confidence_score,
-                detected_pins=scan.detected_pins,
-                expected_pins=scan.expected_pins,
-                has_bottom_scan=scan.has_bottom_scan,
-                was_manual_override=scan.was_manual_override,
-                manufacturer_detected=scan.manufacturer_detected,
-                message=scan.message,
-                scanned_at=scan.scanned_at,
-                completed_at=scan.completed_at,
-                batch_id=scan.batch_id,
-                batch_vender=scan.batch_vender,
-            )
-            for scan in scans
+            _to_list_item(scan) for scan in scans
         ],
         total_count=total_count,
         limit=limit,
         offset=offset,
+    ))
+
+
+@router.get("/stream", response_model=ScanListResult)
+async def stream_scans(
+    status: Optional[str] = Query(None, description="Filter by status"),
+    action_required: Optional[str] = Query(None, description="Filter by required action"),
+    part_number: Optional[str] = Query(None, description="Partial match on part number"),
+    manufacturer: Optional[str] = Query(None, description="Detected manufacturer"),
+    has_bottom_scan: Optional[bool] = Query(None, description="Whether bottom scan exists"),
+    manual_override: Optional[bool] = Query(None, description="Whether manual override occurred"),
+    batch_id: Optional[str] = Query(None, description="Production batch id"),
+    batch_vender: Optional[str] = Query(None, description="Batch vendor"),
+    date_from: Optional[datetime] = Query(None, description="Start date"),
+    date_to: Optional[datetime] = Query(None, description="End date"),
+    limit: Optional[int] = Query(None, ge=1, description="Max rows (default: all matching)"),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Stream scans with the same filters as /list, for exports and large pages.
+
+    Rows are read from a server-side cursor and written to the response one
+    at a time, so memory stays flat regardless of how many scans match.
+    The body has the same shape as /list.
+    """
+    _validate_list_filters(status, action_required)
+
+    rows, total_count = await ScanService.stream_scans(
+        db=db,
+        status=status,
+        action_required=action_required,
+        part_number=part_number,
+        manufacturer=manufacturer,
+        has_bottom_scan=has_bottom_scan,
+        manual_override=manual_override,
+        batch_id=batch_id,
+        batch_vender=batch_vender,
+        date_from=date_from,
+        date_to=date_to,
+        limit=limit,
+        offset=offset,
     )
 
+    async def gen():
+        yield b'{"scans":['
+        first = True
+        async for scan in rows:
+            if not first:
+                yield b","
+            first = False
+            yield dump_json(_to_list_item(scan))
+        effective_limit = limit if limit is not None else max(total_count - offset, 0)
+        yield b'],"total_count":%d,"limit":%d,"offset":%d}' % (
+            total_count, effective_limit, offset,
+        )
+
+    return StreamingResponse(gen(), media_type="application/json")
+
 
 @router.get("/list/enriched", response_model=EnrichedScanListResult)
 async def list_scans_enriched(
@@ -261,46 +338,15 @@ async def list_scans_enriched(
         unique_batches=unique_batches_result.scalar() or 0,
     )
     
-    def parse_json_field(value):
-        """Parse JSON field if it's a string, otherwise return as-is."""
-        if value is None:
-            return None
-        if isinstance(value, str):
-            try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                return None
-        return value
-    
-    return EnrichedScanListResult(
+    return model_response(EnrichedScanListResult(
         scans=[
-            ScanListItem(
-                scan_id=scan.scan_id,
-                part_number=scan.part_number_verified or scan.part_number_detected,
-                part_number_detected=scan.part_number_detected,
-                part_number_candidates=parse_json_field(scan.part_number_candidates),
-                part_number_verified=scan.part_number_verified,
-                status=ScanStatus(scan.status),
-                action_required=ActionRequired(scan.action_required) if scan.action_required else ActionRequired.NONE,
-                confidence_score=scan.confidence_score,
-                detected_pins=scan.detected_pins,
-                expected_pins=scan.expected_pins,
-                has_bottom_scan=scan.has_bottom_scan,
-                was_manual_override=scan.was_manual_override,
-                manufacturer_detected=scan.manufacturer_detected,
-                message=scan.message,
-                scanned_at=scan.scanned_at,
-                completed_at=scan.completed_at,
-                batch_id=scan.batch_id,
-                batch_vender=scan.batch_vender,
-            )
-            for scan in scans
+            _to_list_item(scan) for scan in scans
         ],
         total_count=total_count,
         limit=limit,
         offset=offset,
         stats=stats,
-    )
+    ))
 
 
 @router.get("/analytics", response_model=AnalyticsResponse)
@@ -459,14 +505,8 @@ async def get_scan_analytics(
     )
 
 
-@router.get("/{scan_id}/details", response_model=ScanDetails)
-async def get_scan_details(
-    scan_id: UUID,
-    db: AsyncSession = Depends(get_db),
-):
-    """
-    Get full details of a specific scan.
-    """
+async def _scan_details(scan_id: UUID, db: AsyncSession, include_ic_specification: bool):
+    """Build the details response for a scan, optionally embedding its IC spec."""
     scan = await ScanService.get_by_scan_id(db, scan_id)
     
     if not scan:
@@ -475,48 +515,63 @@ async def get_scan_details(
             detail={"error": "SCAN_NOT_FOUND", "message": "Scan not found"}
         )
     
-    # Get IC specification if available
     ic_spec = None
+    ic_spec_url = None
     part_number = scan.part_number_verified or scan.part_number_detected
     if part_number:
+        ic_spec_url = f"/api/v1/ic/details?part_number={quote(part_number)}"
+    if part_number and include_ic_specification:
         ic_spec_model = await ICService.get_by_part_number(db, part_number)
         if ic_spec_model:
-            ic_spec = ic_spec_model.to_dict()
+            ic_spec = fast_from_orm(
+                ICSpecificationResponse,
+                ic_spec_model,
+                has_datasheet=ic_spec_model.has_datasheet
+                if ic_spec_model.has_datasheet is not None else bool(ic_spec_model.datasheet_path),
+                electrical_specs=ic_spec_model.electrical_specs or {},
+            )
     
-    def parse_json_field(value):
-        """Parse JSON field if it's a string, otherwise return as-is."""
-        if value is None:
-            return None
-        if isinstance(value, str):
-            try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                return None
-        return value
+    match_details = _parse_json_field(scan.match_details)
+    candidates = _parse_json_field(scan.part_number_candidates)
     
-    return ScanDetails(
-        scan_id=scan.scan_id,
-        ocr_text_raw=scan.ocr_text_raw,
-        part_number_detected=scan.part_number_detected,
-        part_number_candidates=parse_json_field(scan.part_number_candidates),
-        part_number_verified=scan.part_number_verified,
+    # Row values are already typed by the ORM; only converted fields are
+    # passed explicitly (model_construct does no coercion).
+    return model_response(fast_from_orm(
+        ScanDetails,
+        scan,
+        part_number_candidates=tuple(candidates) if candidates else None,
         status=ScanStatus(scan.status),
-        confidence_score=scan.confidence_score,
-        detected_pins=scan.detected_pins,
-        expected_pins=scan.expected_pins,
-        manufacturer_detected=scan.manufacturer_detected,
-        batch_id=scan.batch_id,
-        batch_vender=scan.batch_vender,
         action_required=ActionRequired(scan.action_required) if scan.action_required else ActionRequired.NONE,
-        has_bottom_scan=scan.has_bottom_scan,
-        was_manual_override=scan.was_manual_override,
-        operator_note=scan.operator_note,
-        match_details=parse_json_field(scan.match_details),
-        verification_checks=parse_json_field(scan.verification_checks),
-        failure_reasons=parse_json_field(scan.failure_reasons),
-        message=scan.message,
-        scanned_at=scan.scanned_at,
-        completed_at=scan.completed_at,
+        has_bottom_scan=bool(scan.has_bottom_scan),
+        was_manual_override=bool(scan.was_manual_override),
+        match_details=MatchDetails.model_construct(**match_details) if match_details else None,
+        verification_checks=_parse_json_field(scan.verification_checks),
+        failure_reasons=_parse_json_field(scan.failure_reasons),
         ic_specification=ic_spec,
-    )
+        ic_specification_url=ic_spec_url,
+    ), exclude_none=True)
+
 
+@router.get("/{scan_id}/details", response_model=ScanDetails)
+async def get_scan_details(
+    scan_id: UUID,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get details of a specific scan.
+
+    The matched IC specification is not embedded; fetch it on demand from
+    ic_specification_url, or use /{scan_id}/full.
+    """
+    return await _scan_details(scan_id, db, include_ic_specification=False)
+
+
+@router.get("/{scan_id}/full", response_model=ScanDetails)
+async def get_scan_full(
+    scan_id: UUID,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get full details of a specific scan, including the embedded IC specification.
+    """
+    return await _scan_details(scan_id, db, include_ic_specification=True)
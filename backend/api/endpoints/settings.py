@@ -1,13 +1,14 @@
 """Settings endpoints - System configuration management."""
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Body, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any
 import logging
 
 from core.database import get_db
+from api.responses import model_response
 from services import SettingsService
 from schemas import (
     SettingsResponse,
-    SettingsUpdateRequest,
     SettingsUpdateResponse,
 )
 
@@ -24,12 +25,12 @@ async def list_settings(
     Get all system settings.
     """
     settings = await SettingsService.get_all(db)
-    return SettingsResponse(settings=settings)
+    return model_response(SettingsResponse.model_construct(settings=settings))
 
 
 @router.patch("/update", response_model=SettingsUpdateResponse)
 async def update_settings(
-    request: dict,  # Accept any dict
+    request: dict[str, Any] = Body(...),  # Free-form key/value pairs, no model
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -38,17 +39,17 @@ async def update_settings(
     Pass key-value pairs of settings to update.
     """
     if not request:
-        return SettingsUpdateResponse(
+        return model_response(SettingsUpdateResponse.model_construct(
             success=False,
             message="No settings provided to update.",
             updated_settings={},
-        )
+        ))
     
     updated = await SettingsService.update(db, request)
     
-    return SettingsUpdateResponse(
+    return model_response(SettingsUpdateResponse.model_construct(
         success=True,
         message="Settings updated successfully.",
         updated_settings=updated,
-    )
+    ))
 
@@ -1,10 +1,12 @@
 """Sync endpoints - Weekly sync job management."""
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Response
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 import logging
 import asyncio
 
 from core.database import get_db, get_db_for_background
+from api.responses import model_response
 from services import SyncService, QueueService
 from schemas import (
     SyncStartRequest,
@@ -99,6 +101,11 @@ async def start_sync(
     )
 
 
+# Last /status body, keyed by the status values it was built from. The
+# frontend polls while a job runs and most polls see no change.
+_status_cache: Optional[tuple[tuple, bytes]] = None
+
+
 @router.get("/status", response_model=SyncStatusResponse)
 async def get_sync_status(
     db: AsyncSession = Depends(get_db),
@@ -106,11 +113,17 @@ async def get_sync_status(
     """
     Get current sync job status.
     
-    Poll this endpoint to update the progress bar.
+    Poll this endpoint to update the progress bar. Repeat polls with an
+    unchanged status reuse the previously serialized body.
     """
+    global _status_cache
     status = await SyncService.get_status(db)
-    
-    return SyncStatusResponse(
+
+    version = tuple(status.values())
+    if _status_cache is not None and _status_cache[0] == version:
+        return Response(content=_status_cache[1], media_type="application/json")
+
+    response = model_response(SyncStatusResponse(
         job_id=status.get("job_id"),
         status=SyncStatus(status["status"]),
         progress_percentage=status.get("progress_percentage", 0),
@@ -123,7 +136,9 @@ async def get_sync_status(
         started_at=status.get("started_at"),
         estimated_completion=status.get("estimated_completion"),
         message=status.get("message"),
-    )
+    ), exclude_none=True)
+    _status_cache = (version, response.body)
+    return response
 
 
 @router.post("/cancel", response_model=SuccessResponse)
@@ -162,11 +177,11 @@ async def get_sync_history(
     """
     jobs, total_count = await SyncService.get_history(db, limit=limit)
     
-    return SyncHistoryResult(
+    return model_response(SyncHistoryResult(
         sync_jobs=[
             SyncHistoryItem(
                 job_id=job.job_id,
-                status=SyncStatus(job.status),
+                status=job.status,
                 started_at=job.started_at,
                 completed_at=job.completed_at,
                 total_items=job.total_items,
@@ -177,4 +192,4 @@ async def get_sync_history(
             for job in jobs
         ],
         total_count=total_count,
-    )
+    ))
@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from pathlib import Path
+import asyncio
 import logging
 import socket
 
@@ -37,6 +38,48 @@ def set_camera_status(connected: bool, frame_time: datetime = None):
         _last_frame_at = frame_time
 
 
+def _datasheet_folder_usage(folder: Path) -> tuple[int, float]:
+    """Return (pdf count, total size in MB) for the datasheet folder."""
+    if not folder.exists():
+        return 0, 0.0
+    pdf_files = list(folder.glob("*.pdf"))
+    folder_size_mb = sum(f.stat().st_size for f in pdf_files) / (1024 * 1024)
+    return len(pdf_files), folder_size_mb
+
+
+def _internet_available() -> bool:
+    """Blocking reachability probe (public DNS on port 53)."""
+    try:
+        socket.create_connection(("8.8.8.8", 53), timeout=3).close()
+        return True
+    except OSError:
+        return False
+
+
+async def _database_status(db: AsyncSession) -> tuple[bool, int, int, int, LastSyncInfo | None]:
+    """Return (connected, IC count, pending, failed, last sync) from the database."""
+    # Check database
+    db_connected = await check_db_connection()
+    ic_count = 0
+    if db_connected:
+        ic_count = await ICService.get_count(db)
+    
+    # Get queue status
+    pending_count, failed_count = await QueueService.get_status_counts(db)
+    
+    # Get last sync info
+    sync_history, _ = await SyncService.get_history(db, limit=1)
+    last_sync = None
+    if sync_history:
+        last_job = sync_history[0]
+        last_sync = LastSyncInfo(
+            job_id=last_job.job_id,
+            status=SyncStatus(last_job.status),
+            completed_at=last_job.completed_at,
+        )
+    return db_connected, ic_count, pending_count, failed_count, last_sync
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
     """
@@ -57,43 +100,18 @@ async def get_system_status(
     
     Includes database, camera, network, queue, and storage status.
     """
-    # Check database
-    db_connected = await check_db_connection()
-    ic_count = 0
-    if db_connected:
-        ic_count = await ICService.get_count(db)
-    
-    # Check network (try to resolve DNS)
-    internet_available = False
-    try:
-        socket.create_connection(("8.8.8.8", 53), timeout=3)
-        internet_available = True
-    except OSError:
-        pass
-    
-    # Get queue status
-    queue_items, total_count, pending_count, failed_count = await QueueService.list_queue(db)
-    
-    # Get storage info
+    # The network probe and the folder walk block, so they run in threads
+    # while the database reads (one session, so sequential) go ahead
     datasheet_folder = settings.DATASHEET_FOLDER
-    datasheet_count = 0
-    folder_size_mb = 0.0
-    
-    if datasheet_folder.exists():
-        pdf_files = list(datasheet_folder.glob("*.pdf"))
-        datasheet_count = len(pdf_files)
-        folder_size_mb = sum(f.stat().st_size for f in pdf_files) / (1024 * 1024)
-    
-    # Get last sync info
-    sync_history, _ = await SyncService.get_history(db, limit=1)
-    last_sync = None
-    if sync_history:
-        last_job = sync_history[0]
-        last_sync = LastSyncInfo(
-            job_id=last_job.job_id,
-            status=SyncStatus(last_job.status),
-            completed_at=last_job.completed_at,
-        )
+    (
+        (db_connected, ic_count, pending_count, failed_count, last_sync),
+        internet_available,
+        (datasheet_count, folder_size_mb),
+    ) = await asyncio.gather(
+        _database_status(db),
+        asyncio.to_thread(_internet_available),
+        asyncio.to_thread(_datasheet_folder_usage, datasheet_folder),
+    )
     
     # Determine overall status
     overall_status = "operational"
@@ -0,0 +1,43 @@
+"""Response helpers shared by the API routers."""
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _adapter_for(tp: type) -> TypeAdapter:
+    """Build (once per type) the adapter used to dump non-BaseModel payloads."""
+    return TypeAdapter(tp)
+
+
+def dump_json(value: Any) -> bytes:
+    """Encode a single model or dataclass instance to JSON bytes."""
+    if isinstance(value, BaseModel):
+        return value.model_dump_json().encode()
+    return _adapter_for(type(value)).dump_json(value)
+
+
+def model_response(model: Any, status_code: int = 200, exclude_none: bool = False) -> Response:
+    """
+    Serialize an already-built response model straight to JSON.
+
+    Routers keep ``response_model=`` for the OpenAPI schema, but returning a
+    plain Response skips FastAPI re-validating and re-encoding the output,
+    which is the dominant cost on large list responses. BaseModels use their
+    own compiled serializer; anything else (e.g. pydantic dataclasses) goes
+    through a TypeAdapter cached per type.
+
+    exclude_none drops unset optional fields from the body. Only use it on
+    responses whose clients treat missing and null alike.
+    """
+    if isinstance(model, BaseModel):
+        content = model.model_dump_json(exclude_none=exclude_none)
+    else:
+        content = _adapter_for(type(model)).dump_json(model, exclude_none=exclude_none)
+    return Response(
+        content=content,
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -60,12 +60,19 @@ class Settings(BaseSettings):
     
     MAX_SCRAPE_RETRIES: int = 3
     SCRAPE_TIMEOUT_SECONDS: int = 30  # Increased for PDF downloads
+    # Politeness limit per manufacturer host: at most N downloads per window
+    SCRAPE_HOST_MAX_REQUESTS: int = 30
+    SCRAPE_HOST_WINDOW_SECONDS: float = 10.0
     AUTO_QUEUE_UNKNOWN: bool = True
     
     # Scan history
     SCAN_HISTORY_RETENTION_DAYS: int = 365
     ENABLE_AUTO_CLEANUP: bool = True
 
+    # Validate DB-sourced response models (see schemas.common.fast_from_orm);
+    # off in production, enable in tests/debugging to catch schema drift
+    VALIDATE_RESPONSES: bool = False
+
     model_config = SettingsConfigDict(
         env_file=(".env", "../.env"),
         env_file_encoding="utf-8",
@@ -3,7 +3,8 @@ Application constants and enums.
 Central source of truth for all constant values used across the application.
 """
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 
 # ============================================================
@@ -56,9 +57,10 @@ MANUFACTURER_EXAMPLE_ICS: Dict[str, List[str]] = {
 }
 
 
-def get_supported_manufacturers() -> List[str]:
-    """Get list of supported manufacturer codes."""
-    return [m.value for m in Manufacturer]
+@lru_cache(maxsize=1)
+def get_supported_manufacturers() -> Tuple[str, ...]:
+    """Get supported manufacturer codes (cached; the enum is fixed at import)."""
+    return tuple(m.value for m in Manufacturer)
 
 
 def get_manufacturer_name(code: str) -> str:
@@ -11,6 +11,7 @@ from api.endpoints import datasheets
 from api.endpoints import digikey as digikey_router
 from core.config import settings
 from core.database import init_db
+from services.datasheet_storage import close_http_client
 from api.endpoints import (
     scan_router,
     ic_router,
@@ -44,9 +45,14 @@ async def lifespan(app: FastAPI):
         logger.info("Database initialization skipped")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
-    
+
+    # Build the OpenAPI document now instead of on the first /docs hit
+    app.openapi()
+
     yield
 
+    await close_http_client()
+
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
@@ -123,8 +129,17 @@ async def camera_page():
 
 if __name__ == "__main__":
     import uvicorn
+    limit_concurrency = os.environ.get("LIMIT_CONCURRENCY")
     uvicorn.run(
         "main:app",
         # host="0.0.0.0",  # Bind to all interfaces for network access
         port=int(os.environ.get("PORT", 8000)),
+        # uvicorn[standard] installs uvloop + httptools; "auto" uses them when present
+        loop="auto",
+        http="auto",
+        # Batch jobs and the dashboard cache live in process memory, so only
+        # raise this behind sticky routing or once that state is external.
+        workers=int(os.environ.get("WEB_CONCURRENCY", 1)),
+        # Reject with 503 instead of queueing when the server is saturated
+        limit_concurrency=int(limit_concurrency) if limit_concurrency else None,
     )
@@ -130,6 +130,7 @@ CREATE INDEX IF NOT EXISTS idx_ic_specs_manufacturer ON ic_specifications(manufa
 CREATE INDEX IF NOT EXISTS idx_scan_history_scan_id ON scan_history(scan_id);
 CREATE INDEX IF NOT EXISTS idx_scan_history_status ON scan_history(status);
 CREATE INDEX IF NOT EXISTS idx_scan_history_scanned_at ON scan_history(scanned_at);
+CREATE INDEX IF NOT EXISTS idx_scan_history_status_scanned_at ON scan_history(status, scanned_at);
 CREATE INDEX IF NOT EXISTS idx_datasheet_queue_status ON datasheet_queue(status);
 CREATE INDEX IF NOT EXISTS idx_fake_registry_part_number ON fake_registry(part_number);
 CREATE INDEX IF NOT EXISTS idx_sync_jobs_job_id ON sync_jobs(job_id);
@@ -1,5 +1,5 @@
 """Scan History model - Audit trail of all scans."""
-from sqlalchemy import Column, Integer, String, Float, Text, Boolean, DateTime, func
+from sqlalchemy import Column, Integer, String, Float, Text, Boolean, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
 
@@ -12,6 +12,10 @@ class ScanHistory(Base):
     Each scan gets a unique scan_id for tracking.
     """
     __tablename__ = "scan_history"
+    __table_args__ = (
+        # Covers the dashboard's status/date FILTER aggregates
+        Index("idx_scan_history_status_scanned_at", "status", "scanned_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     scan_id = Column(UUID(as_uuid=True), unique=True, nullable=False, default=uuid.uuid4, index=True)
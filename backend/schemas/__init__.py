@@ -9,6 +9,7 @@ from schemas.common import (
     PartNumberSource,
     SuccessResponse,
     ErrorResponse,
+    fast_from_orm,
 )
 from schemas.ic import (
     ICSpecificationBase,
@@ -28,6 +29,8 @@ from schemas.scan import (
 from schemas.scan_verify import (
     VerificationStatus,
     VerificationCheck,
+    VerificationChecks,
+    MatchedIC,
     ScanExtractResult,
     ScanVerifyRequest,
     ScanVerifyResult,
@@ -52,7 +55,6 @@ from schemas.sync import (
 )
 from schemas.settings import (
     SettingsResponse,
-    SettingsUpdateRequest,
     SettingsUpdateResponse,
 )
 from schemas.dashboard import (
@@ -84,6 +86,7 @@ __all__ = [
     "PartNumberSource",
     "SuccessResponse",
     "ErrorResponse",
+    "fast_from_orm",
     # IC
     "ICSpecificationBase",
     "ICSpecificationCreate",
@@ -114,7 +117,6 @@ __all__ = [
     "SyncHistoryResult",
     # Settings
     "SettingsResponse",
-    "SettingsUpdateRequest",
     "SettingsUpdateResponse",
     # Dashboard
     "RecentCounterfeit",
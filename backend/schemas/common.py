@@ -1,7 +1,13 @@
 """Common schema types used across the API."""
 from pydantic import BaseModel
-from typing import Optional, Any
+from typing import Optional, Any, Callable, TypeVar
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+
+from core.config import settings
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
 class ScanStatus(str, Enum):
@@ -64,6 +70,36 @@ class SuccessResponse(BaseModel):
     message: str
 
 
+@lru_cache(maxsize=None)
+def _orm_reader(model_cls: type[BaseModel], obj_type: type) -> tuple[tuple[str, ...], Callable[[Any], Any]]:
+    """
+    Field names shared by a response model and an ORM class, plus a single
+    attrgetter that reads them all in one C-level call. Built once per pair.
+    """
+    names = tuple(name for name in model_cls.model_fields if hasattr(obj_type, name))
+    if len(names) > 1:
+        return names, attrgetter(*names)
+    # attrgetter returns a bare value (not a tuple) for a single name
+    return names, lambda obj: tuple(getattr(obj, name) for name in names)
+
+
+def fast_from_orm(model_cls: type[ModelT], obj: Any, **overrides: Any) -> ModelT:
+    """
+    Build a response model from an ORM row without re-validating it.
+
+    Fields are copied by name from ``obj``; ``overrides`` supply values that
+    need conversion first (enums, nested models, parsed JSON), since
+    model_construct performs no coercion. Set VALIDATE_RESPONSES to run full
+    validation instead.
+    """
+    names, getter = _orm_reader(model_cls, type(obj))
+    values = dict(zip(names, getter(obj)))
+    values.update(overrides)
+    if settings.VALIDATE_RESPONSES:
+        return model_cls.model_validate(values)
+    return model_cls.model_construct(**values)
+
+
 class ErrorResponse(BaseModel):
     """Generic error response."""
     error: str
@@ -1,5 +1,5 @@
 """Pydantic schemas for dashboard operations."""
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
 
@@ -27,5 +27,5 @@ class DashboardStats(BaseModel):
     database_ic_count: int = 0
     last_sync_at: Optional[datetime] = None
     last_sync_status: Optional[SyncStatus] = None
-    recent_counterfeits: list[RecentCounterfeit] = []
+    recent_counterfeits: list[RecentCounterfeit] = Field(default_factory=list)
 
@@ -9,7 +9,10 @@ from datetime import datetime
 from core.constants import Manufacturer, get_supported_manufacturers
 
 # Use the Manufacturer Literal directly from constants
-ManufacturerCode = Manufacturer 
+ManufacturerCode = Manufacturer
+
+# Resolved once at import and reused by every Field description below
+_SUPPORTED_JOINED = ", ".join(get_supported_manufacturers())
 
 
 class DatasheetDownloadRequest(BaseModel):
@@ -26,7 +29,7 @@ class DatasheetDownloadRequest(BaseModel):
         None,
         description=(
             f"Optional manufacturer code. "
-            f"Supported: {', '.join(get_supported_manufacturers())}. "
+            f"Supported: {_SUPPORTED_JOINED}. "
             f"If provided, downloads only from this manufacturer. "
             f"If omitted, tries ALL supported manufacturers in parallel."
         ),
@@ -52,7 +55,7 @@ class DatasheetDownloadResult(BaseModel):
     
     manufacturer: ManufacturerCode = Field(
         ...,
-        description=f"Manufacturer code (one of: {', '.join(get_supported_manufacturers())})"
+        description=f"Manufacturer code (one of: {_SUPPORTED_JOINED})"
     )
     
     manufacturer_name: str = Field(
@@ -1,13 +1,15 @@
 """Pydantic schemas for fake registry operations."""
 from pydantic import BaseModel
+from pydantic.dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 
 from schemas.common import FakeSource
 
 
-class FakeRegistryItem(BaseModel):
-    """Single item in the fake registry."""
+@dataclass(slots=True, kw_only=True)
+class FakeRegistryItem:
+    """Single item in the fake registry (slotted: lists can be large)."""
     part_number: str
     source: FakeSource
     reason: Optional[str] = None
@@ -16,9 +18,6 @@ class FakeRegistryItem(BaseModel):
     scrape_attempts: int = 0
     manufacturers_checked: Optional[list[str]] = None
 
-    class Config:
-        from_attributes = True
-
 
 class FakeListResult(BaseModel):
     """List of fake registry items."""
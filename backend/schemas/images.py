@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List
 from datetime import datetime
 
 
@@ -22,13 +22,31 @@ class ImageUploadRequest(BaseModel):
         }
 
 
+class PreprocessingOptions(BaseModel):
+    """Preprocessing flags applied to an upload."""
+    
+    denoise: bool = True
+    enhance_contrast: bool = False
+    normalize: bool = True
+    edge_prep: bool = False
+
+
+class ImageValidation(BaseModel):
+    """Result of validating an uploaded image."""
+    
+    valid: bool
+    format: Optional[str] = None
+    dimensions: Optional[tuple[int, int]] = Field(None, description="(width, height) in pixels")
+    file_size: Optional[int] = Field(None, description="File size in bytes")
+
+
 class PreprocessingMetadata(BaseModel):
     """Metadata about preprocessing operations."""
     
     steps_applied: List[str] = Field(..., description="List of preprocessing steps applied")
     processed_at: str = Field(..., description="ISO timestamp of when processing occurred")
-    options_used: Dict[str, Any] = Field(..., description="Preprocessing options that were used")
-    validation: Optional[Dict[str, Any]] = Field(None, description="Image validation results")
+    options_used: PreprocessingOptions = Field(..., description="Preprocessing options that were used")
+    validation: Optional[ImageValidation] = Field(None, description="Image validation results")
 
 
 class ImageUploadResponse(BaseModel):
@@ -42,23 +60,8 @@ class ImageUploadResponse(BaseModel):
     preprocessing: PreprocessingMetadata = Field(..., description="Preprocessing pipeline results")
     uploaded_at: str = Field(..., description="ISO timestamp of upload")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "image_id": "550e8400-e29b-41d4-a716-446655440000",
-                "filename": "ic_chip_photo.jpg",
-                "content_type": "image/jpeg",
-                "size_bytes": 2048576,
-                "file_path": "media/550e8400-e29b-41d4-a716-446655440000.jpg",
-                "preprocessing": {
-                    "steps_applied": ["denoise", "normalize"],
-                    "processed_at": "2025-11-30T12:34:56.789Z",
-                    "options_used": {"denoise": True, "normalize": True},
-                    "validation": {"valid": True, "format": "JPEG"}
-                },
-                "uploaded_at": "2025-11-30T12:34:56.789Z"
-            }
-        }
+    # Instances are shared through the upload dedup cache
+    model_config = ConfigDict(frozen=True)
 
 
 class ErrorResponse(BaseModel):
@@ -75,4 +78,21 @@ class ErrorResponse(BaseModel):
                 "error_code": "FILE_TOO_LARGE",
                 "timestamp": "2025-11-30T12:34:56.789Z"
             }
-        }  
\ No newline at end of file
+        }  
+
+
+# Response example for the OpenAPI docs, attached on the upload route
+IMAGE_UPLOAD_RESPONSE_EXAMPLE = {
+    "image_id": "550e8400-e29b-41d4-a716-446655440000",
+    "filename": "ic_chip_photo.jpg",
+    "content_type": "image/jpeg",
+    "size_bytes": 2048576,
+    "file_path": "media/550e8400-e29b-41d4-a716-446655440000.jpg",
+    "preprocessing": {
+        "steps_applied": ["denoise", "normalize"],
+        "processed_at": "2025-11-30T12:34:56.789Z",
+        "options_used": {"denoise": True, "normalize": True},
+        "validation": {"valid": True, "format": "JPEG"}
+    },
+    "uploaded_at": "2025-11-30T12:34:56.789Z"
+}
@@ -1,13 +1,15 @@
 """Pydantic schemas for datasheet queue operations."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 from typing import Optional, List
 from datetime import datetime
 
 from schemas.common import QueueStatus
 
 
-class QueueItem(BaseModel):
-    """Single item in the datasheet queue."""
+@dataclass(slots=True, kw_only=True)
+class QueueItem:
+    """Single item in the datasheet queue (slotted: lists can be large)."""
     part_number: str
     first_seen_at: datetime
     last_scanned_at: Optional[datetime] = None
@@ -16,9 +18,6 @@ class QueueItem(BaseModel):
     retry_count: int = 0
     error_message: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 class QueueListResult(BaseModel):
     """List of queue items with counts and pagination."""
@@ -42,4 +41,6 @@ class QueueAddResponse(BaseModel):
     added_count: int
     already_queued_count: int
     message: str
-    queued_items: list[str]  # Part numbers that were added/updated
+    queued_items: tuple[str, ...]  # Part numbers that were added/updated
+
+    model_config = ConfigDict(frozen=True)
@@ -1,5 +1,6 @@
 """Pydantic schemas for scan operations."""
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 from uuid import UUID
@@ -31,7 +32,7 @@ class ScanResult(BaseModel):
     ocr_text: Optional[str] = None
     image_path: Optional[str] = None
     part_number: Optional[str] = None
-    part_number_candidates: Optional[list[str]] = None 
+    part_number_candidates: Optional[tuple[str, ...]] = None 
     part_number_source: PartNumberSource = PartNumberSource.OCR_BEST_GUESS 
     manufacturer_detected: Optional[str] = None
     detected_pins: Optional[int] = None
@@ -56,12 +57,13 @@ class ManualOverrideRequest(BaseModel):
     operator_note: Optional[str] = None
 
 
-class ScanListItem(BaseModel):
-    """Abbreviated scan info for list responses."""
+@dataclass(slots=True, kw_only=True)
+class ScanListItem:
+    """Abbreviated scan info for list responses (slotted: lists can be large)."""
     scan_id: UUID
     part_number: Optional[str] = None
     part_number_detected: Optional[str] = None
-    part_number_candidates: Optional[list[str]] = None  # Added
+    part_number_candidates: Optional[tuple[str, ...]] = None  # Added
     part_number_verified: Optional[str] = None
     status: ScanStatus
     action_required: ActionRequired = ActionRequired.NONE
@@ -77,9 +79,6 @@ class ScanListItem(BaseModel):
     batch_id: Optional[str] = None
     batch_vender: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 class ScanListResult(BaseModel):
     """Paginated list of scans."""
@@ -94,7 +93,7 @@ class ScanDetails(BaseModel):
     scan_id: UUID
     ocr_text_raw: Optional[str] = None
     part_number_detected: Optional[str] = None
-    part_number_candidates: Optional[list[str]] = None  # Added
+    part_number_candidates: Optional[tuple[str, ...]] = None  # Added
     part_number_verified: Optional[str] = None
     status: ScanStatus
     confidence_score: Optional[float] = None
@@ -113,7 +112,8 @@ class ScanDetails(BaseModel):
     message: Optional[str] = None
     scanned_at: datetime
     completed_at: Optional[datetime] = None
-    ic_specification: Optional[ICSpecificationResponse] = None
+    ic_specification: Optional[ICSpecificationResponse] = None  # Only embedded by /full
+    ic_specification_url: Optional[str] = None  # Where to fetch the IC spec on demand
 
     class Config:
         from_attributes = True
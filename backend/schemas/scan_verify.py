@@ -1,6 +1,6 @@
 """Schemas for scan verification operations."""
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Any
 from datetime import datetime
 from enum import Enum
 from uuid import UUID
@@ -37,6 +37,26 @@ class VerificationCheck(BaseModel):
     reason: Optional[str] = Field(None, description="Detailed reason if check failed")
 
 
+class MatchedIC(BaseModel):
+    """Database record an IC was verified against."""
+    part_number: str
+    manufacturer: Optional[str] = None
+    manufacturer_name: Optional[str] = None
+    pin_count: int
+    package_type: Optional[str] = None
+    description: Optional[str] = None
+    has_datasheet: bool = False
+    datasheet_path: Optional[str] = None
+    datasheet_url: Optional[str] = None
+
+
+class VerificationChecks(BaseModel):
+    """The verification checks run against the database record."""
+    part_number_match: Optional[VerificationCheck] = None
+    pin_count_match: Optional[VerificationCheck] = None
+    manufacturer_match: Optional[VerificationCheck] = None
+
+
 class ScanExtractResult(BaseModel):
     """Result of image extraction (Phase 1 of scan workflow)."""
     scan_id: UUID = Field(..., description="Unique identifier for this scan")
@@ -45,28 +65,13 @@ class ScanExtractResult(BaseModel):
     confidence_score: float = Field(..., ge=0, le=100, description="OCR confidence (0-100)")
     ocr_text: str = Field(..., description="Raw OCR-extracted text")
     part_number_detected: str = Field(..., description="Best guess part number")
-    part_number_candidates: List[str] = Field(..., description="All candidates from OCR")
+    part_number_candidates: tuple[str, ...] = Field(..., description="All candidates from OCR")
     manufacturer_detected: Optional[str] = Field(None, description="Detected manufacturer")
     detected_pins: int = Field(..., ge=0, description="Number of pins detected")
     message: str = Field(..., description="Human-readable status message")
     scanned_at: datetime = Field(..., description="When image was scanned")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "scan_id": "550e8400-e29b-41d4-a716-446655440000",
-                "status": "EXTRACTED",
-                "action_required": "VERIFY",
-                "confidence_score": 94.5,
-                "ocr_text": "LM555CN\nTI\n2024",
-                "part_number_detected": "LM555CN",
-                "part_number_candidates": ["LM555CN", "LM555", "LM555CNTI"],
-                "manufacturer_detected": "Texas Instruments",
-                "detected_pins": 8,
-                "message": "Data extracted successfully. Ready for verification.",
-                "scanned_at": "2025-12-01T10:30:00Z"
-            }
-        }
+    model_config = ConfigDict(frozen=True)
 
 
 class ScanVerifyRequest(BaseModel):
@@ -92,47 +97,60 @@ class ScanVerifyResult(BaseModel):
     status: str = Field(..., description="Unified scan status for frontend compatibility")
     action_required: ActionRequired = Field(..., description="Recommended action")
     part_number: str = Field(..., description="Part number that was verified")
-    matched_ic: Optional[Dict[str, Any]] = Field(None, description="IC spec if found")
-    verification_checks: Dict[str, VerificationCheck] = Field(
+    matched_ic: Optional[MatchedIC] = Field(None, description="IC spec if found")
+    verification_checks: VerificationChecks = Field(
         ..., 
         description="Individual check results with reasons"
     )
     confidence_score: float = Field(..., ge=0, le=100, description="Confidence in result")
     queued_for_sync: bool = Field(default=False, description="True if queued")
-    queued_candidates: Optional[List[str]] = Field(None, description="Candidates queued")
+    queued_candidates: Optional[tuple[str, ...]] = Field(None, description="Candidates queued")
     message: str = Field(..., description="Human-readable message")
     completed_at: datetime = Field(..., description="When verification completed")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "scan_id": "550e8400-e29b-41d4-a716-446655440000",
-                "verification_status": "MATCH_FOUND",
-                "action_required": "NONE",
-                "part_number": "LM555",
-                "matched_ic": {
-                    "part_number": "LM555",
-                    "manufacturer": "TI",
-                    "pin_count": 8,
-                    "package_type": "DIP"
-                },
-                "verification_checks": {
-                    "part_number_match": {
-                        "status": True,
-                        "expected": "LM555",
-                        "actual": "LM555CN",
-                        "reason": None
-                    },
-                    "pin_count_match": {
-                        "status": True,
-                        "expected": 8,
-                        "actual": 8,
-                        "reason": None
-                    }
-                },
-                "confidence_score": 98.5,
-                "queued_for_sync": False,
-                "message": "IC verified successfully. All checks passed.",
-                "completed_at": "2025-12-01T10:35:00Z"
-            }
+
+# Response examples for the OpenAPI docs, attached on the route decorators
+SCAN_EXTRACT_RESULT_EXAMPLE = {
+    "scan_id": "550e8400-e29b-41d4-a716-446655440000",
+    "status": "EXTRACTED",
+    "action_required": "VERIFY",
+    "confidence_score": 94.5,
+    "ocr_text": "LM555CN\nTI\n2024",
+    "part_number_detected": "LM555CN",
+    "part_number_candidates": ["LM555CN", "LM555", "LM555CNTI"],
+    "manufacturer_detected": "Texas Instruments",
+    "detected_pins": 8,
+    "message": "Data extracted successfully. Ready for verification.",
+    "scanned_at": "2025-12-01T10:30:00Z"
+}
+
+SCAN_VERIFY_RESULT_EXAMPLE = {
+    "scan_id": "550e8400-e29b-41d4-a716-446655440000",
+    "verification_status": "MATCH_FOUND",
+    "action_required": "NONE",
+    "part_number": "LM555",
+    "matched_ic": {
+        "part_number": "LM555",
+        "manufacturer": "TI",
+        "pin_count": 8,
+        "package_type": "DIP"
+    },
+    "verification_checks": {
+        "part_number_match": {
+            "status": True,
+            "expected": "LM555",
+            "actual": "LM555CN",
+            "reason": None
+        },
+        "pin_count_match": {
+            "status": True,
+            "expected": 8,
+            "actual": 8,
+            "reason": None
         }
+    },
+    "confidence_score": 98.5,
+    "queued_for_sync": False,
+    "message": "IC verified successfully. All checks passed.",
+    "completed_at": "2025-12-01T10:35:00Z"
+}
@@ -8,13 +8,6 @@ class SettingsResponse(BaseModel):
     settings: dict[str, Any]
 
 
-class SettingsUpdateRequest(BaseModel):
-    """Request to update settings."""
-    # Accept any key-value pairs
-    class Config:
-        extra = "allow"
-
-
 class SettingsUpdateResponse(BaseModel):
     """Response after updating settings."""
     success: bool
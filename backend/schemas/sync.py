@@ -1,5 +1,6 @@
 """Pydantic schemas for sync operations."""
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
@@ -45,8 +46,9 @@ class SyncStatusResponse(BaseModel):
         from_attributes = True
 
 
-class SyncHistoryItem(BaseModel):
-    """Single sync job in history."""
+@dataclass(slots=True, kw_only=True)
+class SyncHistoryItem:
+    """Single sync job in history (slotted: lists can be large)."""
     job_id: UUID
     status: SyncStatus
     started_at: Optional[datetime] = None
@@ -56,9 +58,6 @@ class SyncHistoryItem(BaseModel):
     failed_count: int = 0
     fake_count: int = 0
 
-    class Config:
-        from_attributes = True
-
 
 class SyncHistoryResult(BaseModel):
     """List of past sync jobs."""
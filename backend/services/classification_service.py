@@ -11,17 +11,31 @@ Returns classification scores for routing to appropriate models.
 """
 
 import os
-from pathlib import Path
-from typing import Dict, Any, List
-from PIL import Image
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 import cv2
 import numpy as np
-import sys
 
-# Add path for correct module
-sys.path.insert(0, str(Path(__file__).parent / "correct"))
+from services.correct.classifier import detect_ic_pins_enhanced
 
-from backend.services.correct.classifier import detect_ic_pins_enhanced
+# One worker pool for every classifier instance, created on first batch.
+# The OpenCV calls release the GIL, so images classify in parallel on threads.
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Return the shared classification pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(
+                    max_workers=max(1, (os.cpu_count() or 2) - 1),
+                    thread_name_prefix="classify",
+                )
+    return _pool
 
 
 class ImageClassifier:
@@ -43,25 +57,24 @@ class ImageClassifier:
             }
         """
         try:
-            # Load image
-            img = Image.open(image_path)
+            # Load image (single decode; dimensions come from the array)
             img_cv = cv2.imread(image_path)
 
             if img_cv is None:
                 raise ValueError(f"Could not load image: {image_path}")
 
             # Basic features
-            width, height = img.size
-            size_mb = os.path.getsize(image_path) / (1024 * 1024)
+            height, width = img_cv.shape[:2]
+            size_mb = os.stat(image_path).st_size / (1024 * 1024)
 
             # Text density estimation (rough OCR potential)
             gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
             _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            text_density = np.sum(thresh == 0) / (width * height)
+            text_density = (thresh.size - cv2.countNonZero(thresh)) / gray.size
 
             # Visual complexity (edge density)
             edges = cv2.Canny(gray, 50, 150)
-            complexity = np.sum(edges > 0) / (width * height)
+            complexity = cv2.countNonZero(edges) / gray.size
 
             # Pin visibility (rough estimate via contours)
             contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -172,10 +185,9 @@ class ImageClassifier:
 
         Returns dict of image_path -> classification
         """
-        results = {}
-        for path in image_paths:
-            results[path] = self.classify_image(path)
-        return results
+        if len(image_paths) <= 1:
+            return {path: self.classify_image(path) for path in image_paths}
+        return dict(zip(image_paths, _get_pool().map(self.classify_image, image_paths)))
     
     def _analyze_brightness_for_counterfeit(self, gray: np.ndarray) -> Dict[str, float]:
         """
@@ -190,27 +202,31 @@ class ImageClassifier:
             Dict with brightness metrics for counterfeit detection
         """
         try:
-            # Calculate overall mean brightness
-            mean_brightness = float(np.mean(gray))
-            
-            # Calculate contrast (standard deviation)
-            contrast = float(np.std(gray))
+            # One pass over the image; every statistic below is derived from
+            # the 256-bin histogram instead of re-scanning / masking gray
+            hist = cv2.calcHist([gray], [0], None, [256], [0, 256]).ravel().astype(np.float64)
+            levels = np.arange(256, dtype=np.float64)
+            weighted = hist * levels
+            total = hist.sum()
+
+            # Overall mean brightness and contrast (standard deviation)
+            mean_brightness = float(weighted.sum() / total)
+            contrast = float(np.sqrt(max((weighted * levels).sum() / total - mean_brightness ** 2, 0.0)))
             
-            # Find bright regions (potential text/logo areas)
+            # Find bright regions (potential text/logo areas, > 180)
             # Genuine IC markings typically have moderate brightness
-            _, bright_mask = cv2.threshold(gray, 180, 255, cv2.THRESH_BINARY)
-            bright_pixels = gray[bright_mask > 0]
+            bright_count = hist[181:].sum()
             
             # Calculate font brightness (bright text areas)
-            font_brightness = float(np.mean(bright_pixels)) if len(bright_pixels) > 0 else 0.0
+            font_brightness = float(weighted[181:].sum() / bright_count) if bright_count > 0 else 0.0
             
             # Check for very bright spots (potential remarking/laser etching)
-            very_bright_pixels = gray[gray > 220]
-            logo_brightness = float(np.mean(very_bright_pixels)) if len(very_bright_pixels) > 100 else 0.0
+            very_bright_count = hist[221:].sum()
+            logo_brightness = float(weighted[221:].sum() / very_bright_count) if very_bright_count > 100 else 0.0
             
             # Calculate percentage of very bright pixels (>220)
             # Genuine ICs rarely have large uniformly bright areas
-            bright_pixel_ratio = len(very_bright_pixels) / gray.size
+            bright_pixel_ratio = float(very_bright_count / gray.size)
             
             # Adjust brightness score if large bright areas detected
             if bright_pixel_ratio > 0.05:  # More than 5% very bright
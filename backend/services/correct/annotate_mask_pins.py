@@ -6,6 +6,9 @@ Usage:
         --input debug/006_07_edges.png \
         --output debug/006_07_edges_masked.png
 
+    # Whole directory (output is then a directory)
+    python annotate_mask_pins.py --input-dir debug --pattern "*_edges.png" --output debug/masked
+
 The script:
 - detects slender pin contours around the package outline,
 - masks the package center to hide silkscreen text,
@@ -15,17 +18,21 @@ The script:
 from __future__ import annotations
 
 import argparse
-import math
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 import cv2
 import numpy as np
 
-Point = Tuple[float, float]
-Pin = Tuple[float, float, float] 
+# Pins travel as one (N, 3) float64 array of rows (x, y, area)
+Pins = np.ndarray
 
 _DEFAULT_MAX_AREA = 5000.0
+# Pins closer than this (px) to an already kept pin are duplicates
+DEDUP_RADIUS = 8.0
+_KERNEL_3X3 = np.ones((3, 3), np.uint8)
 
 
 def set_default_max_area(value: float) -> None:
@@ -34,14 +41,13 @@ def set_default_max_area(value: float) -> None:
     _DEFAULT_MAX_AREA = value
 
 
-def find_pin_centers(img: np.ndarray, min_area: float, max_area: float = 5000.0) -> List[Pin]:
-    """Return ordered pins (x, y, area), clockwise starting at top."""
+def find_pin_centers(img: np.ndarray, min_area: float, max_area: float = 5000.0) -> Pins:
+    """Return ordered pins as an (N, 3) array of (x, y, area), clockwise starting at top."""
     gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
 
     _, binary = cv2.threshold(gray, 30, 255, cv2.THRESH_BINARY)
-    kernel = np.ones((3, 3), np.uint8)
-    binary = cv2.dilate(binary, kernel, iterations=1)
-    binary = cv2.erode(binary, kernel, iterations=1)
+    # Dilate then erode with the same kernel, i.e. a closing, in one call
+    binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, _KERNEL_3X3)
 
     contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
@@ -49,52 +55,63 @@ def find_pin_centers(img: np.ndarray, min_area: float, max_area: float = 5000.0)
     cx, cy = w / 2.0, h / 2.0
     min_radius = 0.35 * min(w, h)  
 
-    candidates: List[Pin] = []
-    for contour in contours:
-        x, y, bw, bh = cv2.boundingRect(contour)
-        area = bw * bh
-        if area < min_area or area > max_area:
-            continue
-
-        aspect = max(bw / max(bh, 1), bh / max(bw, 1))
-        if aspect < 1.5 or aspect > 10.0:
-            continue
+    # Filter all bounding boxes at once rather than contour by contour
+    rects = np.array([cv2.boundingRect(c) for c in contours], dtype=np.float64).reshape(-1, 4)
+    bw, bh = rects[:, 2], rects[:, 3]
+    area = bw * bh
+    aspect = np.maximum(bw / np.maximum(bh, 1), bh / np.maximum(bw, 1))
+    px = rects[:, 0] + bw / 2.0
+    py = rects[:, 1] + bh / 2.0
+    dist2 = (px - cx) ** 2 + (py - cy) ** 2
+    keep = (
+        (area >= min_area) & (area <= max_area)
+        & (aspect >= 1.5) & (aspect <= 10.0)
+        & (dist2 >= min_radius ** 2)
+    )
 
-        px, py = x + bw / 2.0, y + bh / 2.0
-        if math.hypot(px - cx, py - cy) < min_radius:
+    px, py, area = px[keep], py[keep], area[keep]
+
+    # Clockwise from the top: stable argsort keeps contour order on ties
+    ang = (np.degrees(np.arctan2(py - cy, px - cx)) - 90.0) % 360.0
+    order = np.argsort(ang, kind="stable")
+    candidates = np.column_stack((px, py, area))[order]
+
+    # Greedy dedup (keep a pin only if > DEDUP_RADIUS from every kept pin).
+    # Kept pins are bucketed on a DEDUP_RADIUS grid, so each candidate is
+    # only compared against the 3x3 neighbouring cells.
+    kept: List[int] = []
+    grid: dict = {}
+    r2 = DEDUP_RADIUS * DEDUP_RADIUS
+    for i, (x, y) in enumerate(candidates[:, :2].tolist()):
+        gx, gy = int(x // DEDUP_RADIUS), int(y // DEDUP_RADIUS)
+        if any(
+            (x - ux) ** 2 + (y - uy) ** 2 <= r2
+            for nx in (gx - 1, gx, gx + 1)
+            for ny in (gy - 1, gy, gy + 1)
+            for ux, uy in grid.get((nx, ny), ())
+        ):
             continue
+        kept.append(i)
+        grid.setdefault((gx, gy), []).append((x, y))
 
-        candidates.append((px, py, float(area)))
-
-    def angle_key(pt: Point) -> float:
-        ang = math.degrees(math.atan2(pt[1] - cy, pt[0] - cx))
-        return (ang - 90.0) % 360.0
-
-    candidates.sort(key=angle_key)
-
-    unique: List[Pin] = []
-    for pt in candidates:
-        if all(math.hypot(pt[0] - up[0], pt[1] - up[1]) > 8.0 for up in unique):
-            unique.append(pt)
+    return candidates[kept]
 
-    return unique
 
-
-def mask_center(img: np.ndarray, ratio: float = 0.55) -> np.ndarray:
-    """Return a copy of the image with the center masked out."""
+def mask_center(img: np.ndarray, ratio: float = 0.55, inplace: bool = False) -> np.ndarray:
+    """Return the image with the center masked out (a copy unless `inplace`)."""
     h, w = img.shape[:2]
     cx, cy = w // 2, h // 2
     half_w = int(w * ratio / 2)
     half_h = int(h * ratio / 2)
-    masked = img.copy()
+    masked = img if inplace else img.copy()
     top_left = (cx - half_w, cy - half_h)
     bottom_right = (cx + half_w, cy + half_h)
     cv2.rectangle(masked, top_left, bottom_right, (0, 0, 0), thickness=-1)
     return masked
 
 
-def annotate(img: np.ndarray, pins: List[Pin]) -> np.ndarray:
-    """Draw pin indices on the image."""
+def annotate(img: np.ndarray, pins: Pins, inplace: bool = False) -> np.ndarray:
+    """Draw pin indices on the image (a copy unless `inplace`)."""
     h, w = img.shape[:2]
     cx, cy = w / 2.0, h / 2.0
     palette = [
@@ -104,12 +121,15 @@ def annotate(img: np.ndarray, pins: List[Pin]) -> np.ndarray:
         (72, 249, 239),  # Cyan
     ]
 
-    annotated = img.copy()
-    for idx, (px, py, _) in enumerate(pins, start=1):
-        vec = np.array([px - cx, py - cy], dtype=float)
-        norm = np.linalg.norm(vec) or 1.0
-        offset = vec / norm * 12.0
-        label_pos = (int(px + offset[0] - 6), int(py + offset[1] + 4))
+    # Label offsets: 12 px outward from the centre, for all pins at once
+    vec = pins[:, :2] - (cx, cy)
+    norm = np.linalg.norm(vec, axis=1)
+    norm[norm == 0] = 1.0
+    label_xy = pins[:, :2] + vec / norm[:, None] * 12.0 + (-6, 4)
+
+    annotated = img if inplace else img.copy()
+    for idx, ((px, py), (lx, ly)) in enumerate(zip(pins[:, :2].tolist(), label_xy.tolist()), start=1):
+        label_pos = (int(lx), int(ly))
 
         color = palette[(idx - 1) % len(palette)]
         cv2.circle(annotated, (int(px), int(py)), 6, color, thickness=2, lineType=cv2.LINE_AA)
@@ -136,17 +156,23 @@ def annotate(img: np.ndarray, pins: List[Pin]) -> np.ndarray:
     return annotated
 
 
-def count_pins_by_side(pins: List[Pin], cx: float, cy: float) -> dict:
+# Side labels in the order of the integer codes returned by _side_codes
+SIDES = ("top", "right", "bottom", "left")
+
+
+def _side_codes(pins: Pins, cx: float, cy: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (pins as an (N, 3) array, side code per pin) using the dominant axis."""
+    arr = np.asarray(pins, dtype=np.float64).reshape(-1, 3)
+    dx, dy = arr[:, 0] - cx, arr[:, 1] - cy
+    horizontal = np.abs(dx) > np.abs(dy)
+    codes = np.where(horizontal, np.where(dx > 0, 1, 3), np.where(dy > 0, 2, 0))
+    return arr, codes
+
+
+def count_pins_by_side(pins: Pins, cx: float, cy: float) -> dict:
     """Count pins per side using dominant axis (QFP style)."""
-    counts = {"top": 0, "right": 0, "bottom": 0, "left": 0}
-    for px, py, _ in pins:
-        dx, dy = px - cx, py - cy
-        if abs(dx) > abs(dy):
-            side = "right" if dx > 0 else "left"
-        else:
-            side = "bottom" if dy > 0 else "top"
-        counts[side] += 1
-    return counts
+    _, codes = _side_codes(pins, cx, cy)
+    return dict(zip(SIDES, np.bincount(codes, minlength=4).tolist()))
 
 
 def pin_side(px: float, py: float, cx: float, cy: float) -> str:
@@ -157,18 +183,15 @@ def pin_side(px: float, py: float, cx: float, cy: float) -> str:
     return "bottom" if dy > 0 else "top"
 
 
-def side_regularity(pins: List[Pin], side: str, cx: float, cy: float) -> Tuple[int, float]:
+def side_regularity(pins: Pins, side: str, cx: float, cy: float) -> Tuple[int, float]:
     """
     Return (count, regularity_score) for a side.
     Score increases with count and uniform spacing (low coefficient of variation).
     """
-    axis_vals: List[float] = []
-    for px, py, _ in pins:
-        if pin_side(px, py, cx, cy) != side:
-            continue
-        axis_vals.append(px if side in ("top", "bottom") else py)
+    arr, codes = _side_codes(pins, cx, cy)
+    axis = 0 if side in ("top", "bottom") else 1
+    axis_vals = np.sort(arr[codes == SIDES.index(side), axis])
 
-    axis_vals.sort()
     count = len(axis_vals)
     if count < 2:
         return count, 0.0
@@ -181,15 +204,88 @@ def side_regularity(pins: List[Pin], side: str, cx: float, cy: float) -> Tuple[i
     return count, score
 
 
+def _process(img: np.ndarray, mask_ratio: float, min_area: float, max_area: float) -> Tuple[np.ndarray, Pins]:
+    """Detect pins and return (annotated masked image, pins)."""
+    pins = find_pin_centers(img, min_area=min_area, max_area=max_area)
+    # One copy end to end: mask a copy of img, then draw on that copy
+    masked = mask_center(img, ratio=mask_ratio)
+    return annotate(masked, pins, inplace=True), pins
+
+
+_STAGE_DONE = object()
+
+
+def run_batch(
+    input_paths: Iterable[Path],
+    output_dir: Path,
+    mask_ratio: float,
+    min_area: float = 300.0,
+    max_area: float | None = None,
+    queue_size: int = 4,
+) -> Dict[Path, int]:
+    """
+    Annotate many images as a three-stage pipeline: read -> detect/annotate -> write.
+
+    Each stage runs on its own thread with bounded queues in between, so
+    decoding the next image and writing the previous one overlap with pin
+    detection (OpenCV releases the GIL). Returns detected pin count per input;
+    unreadable or failing images are reported and skipped.
+    """
+    _max_area = max_area if max_area is not None else _DEFAULT_MAX_AREA
+    output_dir.mkdir(parents=True, exist_ok=True)
+    decoded: queue.Queue = queue.Queue(maxsize=queue_size)
+    annotated: queue.Queue = queue.Queue(maxsize=queue_size)
+    pin_counts: Dict[Path, int] = {}
+
+    def read_stage() -> None:
+        try:
+            for path in input_paths:
+                img = cv2.imread(str(path), cv2.IMREAD_COLOR)
+                if img is None:
+                    print(f"Could not read image: {path}")
+                    continue
+                decoded.put((path, img))
+        finally:
+            decoded.put(_STAGE_DONE)
+
+    def detect_stage() -> None:
+        try:
+            while (item := decoded.get()) is not _STAGE_DONE:
+                path, img = item
+                try:
+                    result, pins = _process(img, mask_ratio, min_area, _max_area)
+                except Exception as e:
+                    print(f"Failed on {path}: {e}")
+                    continue
+                pin_counts[path] = len(pins)
+                annotated.put((output_dir / f"{path.stem}_masked{path.suffix}", result))
+        finally:
+            annotated.put(_STAGE_DONE)
+
+    def write_stage() -> None:
+        while (item := annotated.get()) is not _STAGE_DONE:
+            out_path, result = item
+            # Keep draining on failure so the upstream stages never block
+            try:
+                cv2.imwrite(str(out_path), result)
+            except cv2.error as e:
+                print(f"Could not write {out_path}: {e}")
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        stages = [pool.submit(stage) for stage in (read_stage, detect_stage, write_stage)]
+        for stage in stages:
+            stage.result()
+
+    return pin_counts
+
+
 def run(input_path: Path, output_path: Path, mask_ratio: float, min_area: float = 300.0, max_area: float | None = None) -> None:
     img = cv2.imread(str(input_path), cv2.IMREAD_COLOR)
     if img is None:
         raise SystemExit(f"Could not read image: {input_path}")
 
     _max_area = max_area if max_area is not None else _DEFAULT_MAX_AREA
-    pins = find_pin_centers(img, min_area=min_area, max_area=_max_area)
-    masked = mask_center(img, ratio=mask_ratio)
-    result = annotate(masked, pins)
+    result, pins = _process(img, mask_ratio, min_area, _max_area)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     cv2.imwrite(str(output_path), result)
@@ -219,8 +315,9 @@ def run(input_path: Path, output_path: Path, mask_ratio: float, min_area: float
     # )
     # print(f"Best side:  -> estimated total pins = {estimated_total}")
     # print("Pin labels (idx: x, y, side, area):")
-    for idx, (px, py, area) in enumerate(pins, start=1):
-        side = pin_side(px, py, w / 2.0, h / 2.0)
+    _, codes = _side_codes(pins, w / 2.0, h / 2.0)
+    for idx, ((px, py, area), code) in enumerate(zip(pins.tolist(), codes.tolist()), start=1):
+        side = SIDES[code]
         print(f"  {idx}: {int(px)}, {int(py)}, {side}, area={area:.1f}")
     print(f"Saved: {output_path}")
 
@@ -229,6 +326,13 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Mask center and annotate pins.")
     parser.add_argument("--input", type=Path, default=Path("debug/006_07_edges.png"))
     parser.add_argument("--output", type=Path, default=Path("debug/006_07_edges_masked.png"))
+    parser.add_argument(
+        "--input-dir",
+        type=Path,
+        default=None,
+        help="Process every image in this directory matching --pattern; --output is then a directory.",
+    )
+    parser.add_argument("--pattern", default="*.png", help="Glob used with --input-dir.")
     parser.add_argument(
         "--mask-ratio",
         type=float,
@@ -255,6 +359,14 @@ def main() -> None:
     if args.min_area <= 0:
         raise SystemExit("--min-area must be positive")
 
+    if args.input_dir is not None:
+        inputs = sorted(args.input_dir.glob(args.pattern))
+        pin_counts = run_batch(inputs, args.output, args.mask_ratio, args.min_area, args.max_area)
+        for path, count in pin_counts.items():
+            print(f"  {path.name}: {count} pins")
+        print(f"Saved {len(pin_counts)} images to {args.output}")
+        return
+
     run(args.input, args.output, args.mask_ratio, args.min_area, args.max_area)
 
 
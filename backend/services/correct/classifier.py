@@ -9,7 +9,14 @@ import numpy as np
 from pathlib import Path
 import json
 import argparse
-from typing import Dict, List, Tuple, Set
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Tuple, Set
+
+_KERNEL_3X3 = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+
+SIDES = ('top', 'bottom', 'left', 'right')
 
 
 def load_and_preprocess(image_path: str) -> np.ndarray:
@@ -25,25 +32,27 @@ def load_and_preprocess(image_path: str) -> np.ndarray:
     return img
 
 
-def find_package_contour(img: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-    """
-    Find the IC package contour with optimized edge detection.
-    """
-    # Bilateral filter to preserve edges
-    filtered = cv2.bilateralFilter(img, 9, 75, 75)
-    
-    best_contour = None
+# Fine-tuned Canny thresholds - try wider range with more options
+CANNY_LOW_THRESHOLDS = (15, 20, 25, 30, 40, 50, 60)
+
+# The threshold sweep runs on an image downscaled by this factor; only the
+# winning threshold is then run at full resolution
+CONTOUR_SEARCH_SCALE = 2
+
+
+def _sweep_package_contour(filtered: np.ndarray, thresholds) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+    """Largest contour (> 5% of the image) over the Canny thresholds: (contour, edges, low_thresh)."""
+    img_area = filtered.shape[0] * filtered.shape[1]
+    best = None
     best_area = 0
-    best_edges = None
     
-    # Fine-tuned Canny thresholds - try wider range with more options
-    for low_thresh in [15, 20, 25, 30, 40, 50, 60]:
+    for low_thresh in thresholds:
         edges = cv2.Canny(filtered, low_thresh, low_thresh * 2.5)
         
         # Fine-tuned morphology - balance between detail and connectivity
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
-        edges_dilated = cv2.dilate(edges, kernel, iterations=1)
-        edges_dilated = cv2.morphologyEx(edges_dilated, cv2.MORPH_CLOSE, kernel, iterations=1)
+        # (dilate + close == two dilations and one erosion)
+        edges_dilated = cv2.dilate(edges, _KERNEL_3X3, iterations=2)
+        edges_dilated = cv2.erode(edges_dilated, _KERNEL_3X3, iterations=1)
         
         contours, _ = cv2.findContours(edges_dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
         
@@ -51,129 +60,116 @@ def find_package_contour(img: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
             largest = max(contours, key=cv2.contourArea)
             area = cv2.contourArea(largest)
             
-            img_area = img.shape[0] * img.shape[1]
             if area > img_area * 0.05 and area > best_area:
                 best_area = area
-                best_contour = largest
-                best_edges = edges
+                best = (largest, edges, low_thresh)
     
-    if best_contour is None:
+    return best
+
+
+def find_package_contour(img: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the IC package contour with optimized edge detection.
+    The threshold is picked on a downscaled copy; contour and edges are full resolution.
+    """
+    thresholds = CANNY_LOW_THRESHOLDS
+    h, w = img.shape[:2]
+    if min(h, w) >= 64 * CONTOUR_SEARCH_SCALE:
+        small = cv2.resize(img, (w // CONTOUR_SEARCH_SCALE, h // CONTOUR_SEARCH_SCALE),
+                           interpolation=cv2.INTER_AREA)
+        picked = _sweep_package_contour(cv2.bilateralFilter(small, 9, 75, 75), thresholds)
+        if picked is not None:
+            thresholds = (picked[2],)
+    
+    # Bilateral filter to preserve edges
+    filtered = cv2.bilateralFilter(img, 9, 75, 75)
+    best = _sweep_package_contour(filtered, thresholds)
+    if best is None and thresholds != CANNY_LOW_THRESHOLDS:
+        best = _sweep_package_contour(filtered, CANNY_LOW_THRESHOLDS)
+    
+    if best is None:
         raise ValueError("Could not find IC package contour")
     
-    return best_contour, best_edges
+    return best[0], best[1]
 
 
 def split_contour_by_sides(contour: np.ndarray, bbox: Tuple[int, int, int, int],
-                           margin_percent: float = 0.12) -> Dict[str, np.ndarray]:
+                           margin_percent: float = 0.12,
+                           exclusive: bool = True) -> Dict[str, np.ndarray]:
     """
     Split contour points into 4 sides - optimized margin.
+    With exclusive=False each side keeps every point inside its margin band,
+    so corner points belong to two sides (what spike detection expects).
     """
     x, y, w, h = bbox
     margin = int(min(w, h) * margin_percent)  # Fine-tuned to 12%
     
-    sides = {'top': [], 'bottom': [], 'left': [], 'right': []}
+    pts = contour.reshape(-1, 2)
+    px, py = pts[:, 0], pts[:, 1]
     
-    for point in contour:
-        px, py = point[0]
-        
-        if py < y + margin:
-            sides['top'].append(point[0])
-        elif py > y + h - margin:
-            sides['bottom'].append(point[0])
-        elif px < x + margin:
-            sides['left'].append(point[0])
-        elif px > x + w - margin:
-            sides['right'].append(point[0])
-    
-    for side in sides:
-        if len(sides[side]) > 0:
-            sides[side] = np.array(sides[side])
-        else:
-            sides[side] = np.array([]).reshape(0, 2)
+    if not exclusive:
+        return {
+            'top': pts[py < y + margin],
+            'bottom': pts[py > y + h - margin],
+            'left': pts[px < x + margin],
+            'right': pts[px > x + w - margin],
+        }
+    
+    # Same precedence as top > bottom > left > right: each point lands on one side
+    top = py < y + margin
+    rest = ~top
+    bottom = rest & (py > y + h - margin)
+    rest &= ~bottom
+    left = rest & (px < x + margin)
+    rest &= ~left
+    right = rest & (px > x + w - margin)
+    
+    sides = {'top': pts[top], 'bottom': pts[bottom], 'left': pts[left], 'right': pts[right]}
     
     return sides
 
 
-def detect_spikes_on_side(contour: np.ndarray, side_name: str, 
-                          bbox: Tuple[int, int, int, int],
-                          margin_percent: float = 0.12,
+# side -> (axis across the side, outward direction along it, axis along the side)
+_SIDE_AXES = {
+    'top': (1, -1, 0),
+    'bottom': (1, 1, 0),
+    'left': (0, -1, 1),
+    'right': (0, 1, 1),
+}
+
+
+def detect_spikes_on_side(side_points: np.ndarray, side_name: str,
                           spike_prominence: float = 2.0) -> Tuple[int, List[np.ndarray], float]:
     """
     Detect outward spikes with enhanced parameters.
+    side_points: (N, 2) points of this side from split_contour_by_sides(exclusive=False)
     Returns: (spike_count, spike_points, avg_spike_depth)
     """
-    x, y, w, h = bbox
-    margin = int(min(w, h) * margin_percent)
-    
-    side_points = []
-    for point in contour:
-        px, py = point[0]
-        
-        if side_name == 'top' and py < y + margin:
-            side_points.append(point[0])
-        elif side_name == 'bottom' and py > y + h - margin:
-            side_points.append(point[0])
-        elif side_name == 'left' and px < x + margin:
-            side_points.append(point[0])
-        elif side_name == 'right' and px > x + w - margin:
-            side_points.append(point[0])
-    
     if len(side_points) < 10:
         return 0, [], 0.0
     
-    side_points = np.array(side_points)
-    
-    # Fit reference line
-    if side_name in ['top', 'bottom']:
-        reference = np.median(side_points[:, 1])
-        
-        if side_name == 'top':
-            outward_points = side_points[side_points[:, 1] < reference - spike_prominence]
-            depths = reference - outward_points[:, 1] if len(outward_points) > 0 else []
-        else:
-            outward_points = side_points[side_points[:, 1] > reference + spike_prominence]
-            depths = outward_points[:, 1] - reference if len(outward_points) > 0 else []
-    else:
-        reference = np.median(side_points[:, 0])
-        
-        if side_name == 'left':
-            outward_points = side_points[side_points[:, 0] < reference - spike_prominence]
-            depths = reference - outward_points[:, 0] if len(outward_points) > 0 else []
-        else:
-            outward_points = side_points[side_points[:, 0] > reference + spike_prominence]
-            depths = outward_points[:, 0] - reference if len(outward_points) > 0 else []
+    # Fit reference line; depth is the signed outward distance from it
+    cross_axis, outward, primary_axis = _SIDE_AXES[side_name]
+    coords = side_points[:, cross_axis]
+    offsets = (coords - np.median(coords)) * outward
+    is_outward = offsets > spike_prominence
+    outward_points = side_points[is_outward]
     
     if len(outward_points) < 3:
         return 0, [], 0.0
     
     # Calculate average spike depth
-    avg_depth = np.mean(depths) if len(depths) > 0 else 0.0
+    avg_depth = np.mean(offsets[is_outward])
     
     # Cluster spikes - fine-tuned clustering distance
-    if side_name in ['top', 'bottom']:
-        sorted_points = outward_points[np.argsort(outward_points[:, 0])]
-        primary_axis = 0
-    else:
-        sorted_points = outward_points[np.argsort(outward_points[:, 1])]
-        primary_axis = 1
+    axis_vals = np.sort(outward_points[:, primary_axis])
     
     # Fine-tuned: gap > 4 pixels for new spike (was 5)
-    spikes = []
-    current_spike = [sorted_points[0]]
-    
-    for i in range(1, len(sorted_points)):
-        gap = sorted_points[i][primary_axis] - sorted_points[i-1][primary_axis]
-        if gap < 4:
-            current_spike.append(sorted_points[i])
-        else:
-            if len(current_spike) >= 2:
-                spikes.append(np.array(current_spike))
-            current_spike = [sorted_points[i]]
-    
-    if len(current_spike) >= 2:
-        spikes.append(np.array(current_spike))
+    breaks = np.flatnonzero(np.diff(axis_vals) >= 4) + 1
+    cluster_sizes = np.diff(np.concatenate(([0], breaks, [len(axis_vals)])))
+    spike_count = int(np.count_nonzero(cluster_sizes >= 2))
     
-    return len(spikes), outward_points, avg_depth
+    return spike_count, outward_points, avg_depth
 
 
 def analyze_side_texture(img: np.ndarray, bbox: Tuple[int, int, int, int], 
@@ -203,17 +199,18 @@ def analyze_side_texture(img: np.ndarray, bbox: Tuple[int, int, int, int],
     edge_density = np.count_nonzero(edges) / (roi.size + 1)
     
     # Variance (roughness indicator)
-    variance = np.var(roi) / 255.0
+    _, stddev = cv2.meanStdDev(roi)
+    variance = float(stddev[0, 0]) ** 2 / 255.0
     
-    # Gradient magnitude (Sobel)
+    # Gradient magnitude (Sobel); a 3x3 Sobel of uint8 fits in int16 exactly
     if side_name in ['top', 'bottom']:
         # Vertical gradients for horizontal sides
-        gradient = cv2.Sobel(roi, cv2.CV_64F, 0, 1, ksize=3)
+        gradient = cv2.Sobel(roi, cv2.CV_16S, 0, 1, ksize=3)
     else:
         # Horizontal gradients for vertical sides
-        gradient = cv2.Sobel(roi, cv2.CV_64F, 1, 0, ksize=3)
+        gradient = cv2.Sobel(roi, cv2.CV_16S, 1, 0, ksize=3)
     
-    gradient_mag = np.mean(np.abs(gradient)) / 255.0
+    gradient_mag = cv2.norm(gradient, cv2.NORM_L1) / gradient.size / 255.0
     
     return {
         'edge_density': edge_density,
@@ -241,35 +238,30 @@ def detect_ic_pins_enhanced(image_path: str,
     contour, edges = find_package_contour(img)
     
     x, y, w, h = cv2.boundingRect(contour)
-    sides = split_contour_by_sides(contour, (x, y, w, h))
+    sides = split_contour_by_sides(contour, (x, y, w, h), exclusive=False)
     
-    # Spike detection
+    # Spike detection, texture analysis and combined scoring per side
     spike_counts = {}
     spike_points = {}
     spike_depths = {}
+    texture_scores = {}
+    combined_scores = {}
     
-    for side in ['top', 'bottom', 'left', 'right']:
-        count, points, depth = detect_spikes_on_side(contour, side, (x, y, w, h))
+    for side in SIDES:
+        count, points, depth = detect_spikes_on_side(sides[side], side)
         spike_counts[side] = count
         spike_points[side] = points
         spike_depths[side] = depth
-    
-    # Texture analysis
-    texture_scores = {}
-    for side in ['top', 'bottom', 'left', 'right']:
+        
         metrics = analyze_side_texture(img, (x, y, w, h), side)
         # Combined texture score
-        score = (metrics['edge_density'] * 0.4 + 
-                metrics['variance'] * 0.3 + 
-                metrics['gradient_mag'] * 0.3)
-        texture_scores[side] = score
-    
-    # Combined scoring: spike count + texture
-    combined_scores = {}
-    for side in ['top', 'bottom', 'left', 'right']:
+        texture_score = (metrics['edge_density'] * 0.4 + 
+                         metrics['variance'] * 0.3 + 
+                         metrics['gradient_mag'] * 0.3)
+        texture_scores[side] = texture_score
+        
         # Normalize spike count (0-1 range, assuming max ~20 spikes)
-        spike_score = min(spike_counts[side] / 20.0, 1.0)
-        texture_score = texture_scores[side]
+        spike_score = min(count / 20.0, 1.0)
         
         # Weighted combination
         combined_scores[side] = (spike_score * (1 - texture_weight) + 
@@ -465,7 +457,7 @@ def create_enhanced_debug(img: np.ndarray, contour: np.ndarray,
                 font, 0.6, (255, 255, 255), 2)
     
     y_offset = 90
-    for side in ['top', 'bottom', 'left', 'right']:
+    for side in SIDES:
         count = spike_counts[side]
         score = combined_scores[side]
         status = "PINS" if side in sides_with_pins else "smooth"
@@ -477,12 +469,29 @@ def create_enhanced_debug(img: np.ndarray, contour: np.ndarray,
     return debug_img
 
 
+def _detect_or_error(image_path: str, spike_threshold: int, ratio_threshold: float,
+                     texture_weight: float, debug: bool):
+    """Worker wrapper: return the result, or the error so one bad image doesn't stop the batch."""
+    try:
+        return detect_ic_pins_enhanced(image_path, spike_threshold,
+                                       ratio_threshold, texture_weight, debug), None
+    except Exception as e:
+        return None, e
+
+
 def process_folder(folder_path: str, output_json: str, 
                   spike_threshold: int, ratio_threshold: float, 
-                  texture_weight: float, debug: bool):
-    """Process all images."""
+                  texture_weight: float, debug: bool,
+                  workers: Optional[int] = None):
+    """Process all images, in parallel across `workers` processes (default: CPU count)."""
     folder = Path(folder_path)
     results = []
+    img_paths = [p for p in sorted(folder.iterdir())
+                 if p.suffix.lower() in {'.png', '.jpg', '.jpeg'}]
+    detect = partial(_detect_or_error, spike_threshold=spike_threshold,
+                     ratio_threshold=ratio_threshold,
+                     texture_weight=texture_weight, debug=debug)
+    workers = workers or os.cpu_count() or 1
     
     print("=" * 110)
     print("ENHANCED SPIKE + TEXTURE DETECTION")
@@ -490,23 +499,27 @@ def process_folder(folder_path: str, output_json: str,
     print(f"{'Image':<20} {'Classification':<20} {'Sides':<25} {'Spikes (T/B/L/R)':<20} {'Method'}")
     print("-" * 110)
     
-    for img_path in sorted(folder.iterdir()):
-        if img_path.suffix.lower() in {'.png', '.jpg', '.jpeg'}:
-            try:
-                result = detect_ic_pins_enhanced(str(img_path), spike_threshold,
-                                                ratio_threshold, texture_weight, debug)
-                results.append(result)
-                
-                sides_str = ",".join(result['sides_with_pins']) if result['sides_with_pins'] else "NONE"
-                sc = result['spike_counts']
-                spikes_str = f"{sc['top']}/{sc['bottom']}/{sc['left']}/{sc['right']}"
-                method = result['detection_method'][:15]
-                
-                print(f"{result['filename']:<20} {result['classification']:<20} "
-                      f"{sides_str:<25} {spikes_str:<20} {method}")
-                
-            except Exception as e:
-                print(f"{img_path.name:<20} ERROR: {e}")
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        outcomes = (executor.map(detect, map(str, img_paths), chunksize=4) if executor
+                    else map(detect, map(str, img_paths)))
+        # map() keeps folder order, so the report is the same as a serial run
+        for img_path, (result, error) in zip(img_paths, outcomes):
+            if error is not None:
+                print(f"{img_path.name:<20} ERROR: {error}")
+                continue
+            results.append(result)
+            
+            sides_str = ",".join(result['sides_with_pins']) if result['sides_with_pins'] else "NONE"
+            sc = result['spike_counts']
+            spikes_str = f"{sc['top']}/{sc['bottom']}/{sc['left']}/{sc['right']}"
+            method = result['detection_method'][:15]
+            
+            print(f"{result['filename']:<20} {result['classification']:<20} "
+                  f"{sides_str:<25} {spikes_str:<20} {method}")
+    finally:
+        if executor:
+            executor.shutdown()
     
     print("=" * 110)
     print(f"Processed {len(results)} images")
@@ -539,13 +552,15 @@ def main():
                        help="Ratio threshold for dominant axis (default: 1.5)")
     parser.add_argument("--texture-weight", "-w", type=float, default=0.3,
                        help="Weight for texture features 0-1 (default: 0.3)")
+    parser.add_argument("--workers", "-j", type=int, default=None,
+                       help="Worker processes for folders (default: CPU count)")
     
     args = parser.parse_args()
     
     input_path = Path(args.input)
     if input_path.is_dir():
         process_folder(str(input_path), args.output, args.threshold, 
-                      args.ratio, args.texture_weight, args.debug)
+                      args.ratio, args.texture_weight, args.debug, args.workers)
     else:
         result = detect_ic_pins_enhanced(str(input_path), args.threshold, 
                                         args.ratio, args.texture_weight, args.debug)
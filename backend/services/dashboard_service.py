@@ -1,64 +1,136 @@
 """Service for dashboard statistics."""
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+import asyncio
 import logging
+import time
 
-from services.scan_service import ScanService
-from services.ic_service import ICService
-from services.queue_service import QueueService
-from services.fake_service import FakeService
-from services.sync_service import SyncService
 from schemas import DashboardStats
 
 logger = logging.getLogger(__name__)
 
+# Dashboard is polled by the frontend; serve repeated ticks from memory.
+STATS_CACHE_TTL_SECONDS = 30.0
+
+# All dashboard figures in one round trip. Scan counts use conditional
+# aggregation (served by idx_scan_history_status_scanned_at), the other
+# tables are scalar subqueries and the two "latest" lookups are LATERAL joins.
+DASHBOARD_STATS_SQL = text("""
+SELECT
+    s.total_scans,
+    s.scans_today,
+    s.scans_this_week,
+    s.pass_count,
+    s.fail_count,
+    s.unknown_count,
+    s.counterfeit_count,
+    (SELECT COUNT(*) FROM datasheet_queue) AS queue_size,
+    (SELECT COUNT(*) FROM fake_registry) AS fake_registry_size,
+    (SELECT COUNT(*) FROM ic_specifications) AS database_ic_count,
+    ls.last_sync_at,
+    ls.last_sync_status,
+    rc.recent_counterfeits
+FROM (
+    SELECT
+        COUNT(*) AS total_scans,
+        COUNT(*) FILTER (WHERE scanned_at >= :today_start) AS scans_today,
+        COUNT(*) FILTER (WHERE scanned_at >= :week_start) AS scans_this_week,
+        COUNT(*) FILTER (WHERE status = 'PASS') AS pass_count,
+        COUNT(*) FILTER (WHERE status = 'FAIL') AS fail_count,
+        COUNT(*) FILTER (WHERE status = 'UNKNOWN') AS unknown_count,
+        COUNT(*) FILTER (WHERE status = 'COUNTERFEIT') AS counterfeit_count
+    FROM scan_history
+) s
+LEFT JOIN LATERAL (
+    SELECT COALESCE(completed_at, started_at) AS last_sync_at, status AS last_sync_status
+    FROM sync_jobs
+    WHERE status IN ('COMPLETED', 'ERROR', 'CANCELLED')
+    ORDER BY started_at DESC
+    LIMIT 1
+) ls ON TRUE
+LEFT JOIN LATERAL (
+    SELECT COALESCE(
+        json_agg(json_build_object('part_number', c.part_number, 'scanned_at', c.scanned_at)
+                 ORDER BY c.scanned_at DESC),
+        '[]'::json
+    ) AS recent_counterfeits
+    FROM (
+        SELECT COALESCE(part_number_verified, part_number_detected) AS part_number, scanned_at
+        FROM scan_history
+        WHERE status = 'COUNTERFEIT'
+        ORDER BY scanned_at DESC
+        LIMIT 5
+    ) c
+) rc ON TRUE
+""")
+
 
 class DashboardService:
     """Service for dashboard statistics aggregation."""
 
+    _cached_stats: Optional[DashboardStats] = None
+    _cached_at: float = 0.0
+    # Serializes refreshes so concurrent polls after expiry share one query
+    _refresh_lock = asyncio.Lock()
+
+    @staticmethod
+    def _fresh_stats() -> Optional[DashboardStats]:
+        cached = DashboardService._cached_stats
+        if cached is not None and time.monotonic() - DashboardService._cached_at < STATS_CACHE_TTL_SECONDS:
+            return cached
+        return None
+
     @staticmethod
     async def get_stats(db: AsyncSession) -> DashboardStats:
-        """Get comprehensive dashboard statistics."""
-        # Get scan stats
-        scan_stats = await ScanService.get_stats(db)
-        
-        # Get IC count
-        ic_count = await ICService.get_count(db)
-        
-        # Get queue size
-        queue_items, total_count, pending_count, failed_count = await QueueService.list_queue(db)
-        queue_size = total_count
-        
-        # Get fake registry size
-        fake_count = await FakeService.get_count(db)
-        
-        # Get last sync info
-        sync_history, _ = await SyncService.get_history(db, limit=1)
-        last_sync_at = None
-        last_sync_status = None
-        if sync_history:
-            last_sync = sync_history[0]
-            last_sync_at = last_sync.completed_at or last_sync.started_at
-            last_sync_status = last_sync.status
-        
-        return DashboardStats(
-            total_scans=scan_stats["total_scans"],
-            scans_today=scan_stats["scans_today"],
-            scans_this_week=scan_stats["scans_this_week"],
-            pass_count=scan_stats["pass_count"],
-            fail_count=scan_stats["fail_count"],
-            unknown_count=scan_stats["unknown_count"],
-            counterfeit_count=scan_stats["counterfeit_count"],
-            pass_rate_percentage=scan_stats["pass_rate_percentage"],
-            queue_size=queue_size,
-            fake_registry_size=fake_count,
-            database_ic_count=ic_count,
-            last_sync_at=last_sync_at,
-            last_sync_status=last_sync_status,
-            recent_counterfeits=[
-                {"part_number": c["part_number"], "scanned_at": datetime.fromisoformat(c["scanned_at"]) if c["scanned_at"] else None}
-                for c in scan_stats["recent_counterfeits"]
-            ],
+        """Get comprehensive dashboard statistics (cached for STATS_CACHE_TTL_SECONDS)."""
+        cached = DashboardService._fresh_stats()
+        if cached is not None:
+            return cached
+
+        async with DashboardService._refresh_lock:
+            # Another request may have refreshed while we waited
+            cached = DashboardService._fresh_stats()
+            if cached is not None:
+                return cached
+
+            stats = await DashboardService._query_stats(db)
+            DashboardService._cached_stats = stats
+            DashboardService._cached_at = time.monotonic()
+            return stats
+
+    @staticmethod
+    async def _query_stats(db: AsyncSession) -> DashboardStats:
+        """Run the single aggregation query and map it onto DashboardStats."""
+        today_start = datetime.combine(
+            datetime.now(timezone.utc).date(), datetime.min.time(), tzinfo=timezone.utc
+        )
+        week_start = today_start - timedelta(days=7)
+
+        result = await db.execute(
+            DASHBOARD_STATS_SQL,
+            {"today_start": today_start, "week_start": week_start},
         )
+        row = result.mappings().one()
 
+        total_scans = row["total_scans"] or 0
+        pass_count = row["pass_count"] or 0
+        pass_rate = (pass_count / total_scans) * 100 if total_scans > 0 else 0.0
+
+        return DashboardStats(
+            total_scans=total_scans,
+            scans_today=row["scans_today"] or 0,
+            scans_this_week=row["scans_this_week"] or 0,
+            pass_count=pass_count,
+            fail_count=row["fail_count"] or 0,
+            unknown_count=row["unknown_count"] or 0,
+            counterfeit_count=row["counterfeit_count"] or 0,
+            pass_rate_percentage=round(pass_rate, 1),
+            queue_size=row["queue_size"] or 0,
+            fake_registry_size=row["fake_registry_size"] or 0,
+            database_ic_count=row["database_ic_count"] or 0,
+            last_sync_at=row["last_sync_at"],
+            last_sync_status=row["last_sync_status"],
+            recent_counterfeits=row["recent_counterfeits"] or [],
+        )
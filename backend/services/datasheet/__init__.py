@@ -7,11 +7,13 @@ from .exceptions import (
     DatasheetDownloadException,
     UnsupportedManufacturerException,
 )
+from .providers import DatasheetProvider
 
 __all__ = [
     "DatasheetService",
     "datasheet_service",
     "DatasheetDownloadException",
     "UnsupportedManufacturerException",
+    "DatasheetProvider",
 ]
 
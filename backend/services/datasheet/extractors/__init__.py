@@ -1,31 +1,70 @@
 """
 PDF data extractors for different manufacturers.
 Each manufacturer's PDF has different structure, so separate extractors are needed.
+
+Extractor modules (and the PDF libraries they pull in) are imported on first
+use, so importing this package - which the app does at startup - stays cheap.
 """
+import importlib
+from collections.abc import Mapping
+
 from .base import DatasheetExtractor
-from .stm_extractor import STMExtractor
-from .ti_extractor import TIExtractor
-from .onsemi_extractor import OnSemiExtractor
-from .nxp_extractor import NXPExtractor
-from .microchip_extractor import MicrochipExtractor
-from .infineon_extractor import InfineonExtractor
-from .analog_devices_extractor import AnalogDevicesExtractor
-from .atmel_extractor import AtmelExtractor
-from .raspberrypi_extractor import RaspberryPiExtractor
 
-# Registry of supported manufacturers -> extractor classes
-EXTRACTORS = {
-    "STM": STMExtractor,
-    "TI": TIExtractor,
-    "ONSEMI": OnSemiExtractor,
-    "NXP": NXPExtractor,
-    "MICROCHIP": MicrochipExtractor,
-    "INFINEON": InfineonExtractor,
-    "ANALOG_DEVICES": AnalogDevicesExtractor,
-    "ATMEL": AtmelExtractor,
-    "RASPBERRY_PI": RaspberryPiExtractor,
+# Manufacturer code -> (module, class) of its extractor
+_EXTRACTOR_MODULES = {
+    "STM": (".stm_extractor", "STMExtractor"),
+    "TI": (".ti_extractor", "TIExtractor"),
+    "ONSEMI": (".onsemi_extractor", "OnSemiExtractor"),
+    "NXP": (".nxp_extractor", "NXPExtractor"),
+    "MICROCHIP": (".microchip_extractor", "MicrochipExtractor"),
+    "INFINEON": (".infineon_extractor", "InfineonExtractor"),
+    "ANALOG_DEVICES": (".analog_devices_extractor", "AnalogDevicesExtractor"),
+    "ATMEL": (".atmel_extractor", "AtmelExtractor"),
+    "RASPBERRY_PI": (".raspberrypi_extractor", "RaspberryPiExtractor"),
 }
 
+_CLASS_MODULES = {class_name: module for module, class_name in _EXTRACTOR_MODULES.values()}
+
+
+def _load_class(module: str, class_name: str) -> type:
+    return getattr(importlib.import_module(module, __name__), class_name)
+
+
+class _LazyExtractorRegistry(Mapping):
+    """Read-only manufacturer -> extractor class map that imports each class on first access."""
+
+    def __init__(self, specs: dict):
+        self._specs = specs
+        self._loaded: dict = {}
+
+    def __getitem__(self, manufacturer_code: str) -> type:
+        extractor_class = self._loaded.get(manufacturer_code)
+        if extractor_class is None:
+            module, class_name = self._specs[manufacturer_code]
+            extractor_class = self._loaded[manufacturer_code] = _load_class(module, class_name)
+        return extractor_class
+
+    def __contains__(self, manufacturer_code: object) -> bool:
+        return manufacturer_code in self._specs
+
+    def __iter__(self):
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+
+# Registry of supported manufacturers -> extractor classes
+EXTRACTORS = _LazyExtractorRegistry(_EXTRACTOR_MODULES)
+
+
+def __getattr__(name: str):
+    """Resolve `from .extractors import STMExtractor` etc. lazily."""
+    if name in _CLASS_MODULES:
+        return _load_class(_CLASS_MODULES[name], name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "DatasheetExtractor",
     "STMExtractor",
@@ -39,4 +78,3 @@ __all__ = [
     "RaspberryPiExtractor",
     "EXTRACTORS",
 ]
-
@@ -20,6 +20,60 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Regexes used on every extraction, compiled once at import
+
+# VDD with tolerance: "VDD = 2.5 V ± 5%" -> 2.375 to 2.625 (case-sensitive)
+_VOLTAGE_TOLERANCE_RE = re.compile(r'V[Dd][Dd]\s*[=:]\s*(\d+\.?\d*)\s*V\s*[±]\s*(\d+)%')
+
+_VOLTAGE_RES = [re.compile(p, re.IGNORECASE) for p in (
+    # AVDD/DVDD range
+    r'[AD]VDD\s*[=:]\s*(\d+\.?\d*)\s*V?\s*(?:to|[-–~])\s*(\d+\.?\d*)\s*V',
+    # Supply voltage range
+    r'[Ss]upply\s+[Vv]oltage[^\\d]*(\\d+\\.?\\d*)\\s*V?\\s*(?:to|[-–~])\\s*(\\d+\\.?\\d*)\\s*V',
+    # Operating voltage
+    r'[Oo]perating\s+[Vv]oltage[^\\d]*(\\d+\\.?\\d*)\\s*V?\\s*(?:to|[-–~])\\s*(\\d+\\.?\\d*)\\s*V',
+    # Generic "X.X V to Y.Y V"
+    r'(\d+\.?\d*)\s*V\s*(?:to|[-–~])\s*(\d+\.?\d*)\s*V(?:\s|,|$)',
+)]
+
+_TEMP_RES = [re.compile(p, re.IGNORECASE) for p in (
+    # Standard format: "-40°C to +125°C"
+    r'(-?\d+)\s*°?\s*C\s*(?:to|[-~])\s*\+?(\d+)\s*°?\s*C',
+    # Temperature range in specifications
+    r'[Tt]emperature\s+[Rr]ange[:\s]+(-?\d+)\s*°?\s*C?\s*(?:to|[-~])\s*\+?(\d+)',
+    # Operating temperature
+    r'[Oo]perating\s+[Tt]emperature[:\s]+(-?\d+)\s*°?\s*C?\s*(?:to|[-~])\s*\+?(\d+)',
+    # Specified for temperature range
+    r'[Ss]pecified\s+for\s+(-?\d+)\s*°?\s*C?\s*(?:to|[-~])\s*\+?(\d+)',
+)]
+
+# "Figure XX. NN-Lead ... [PACKAGE]" followed by a line with dimensions
+_DIM_FIGURE_RE = re.compile(
+    r'Figure\s*\d+\.\s*(\d+)-[Ll]ead[^[]*\[([A-Z]+)\][^\n]*\n([^\n]*(?:\d+\.?\d*)\s*mm[^\n]*)',
+    re.IGNORECASE,
+)
+_DIM_BODY_RE = re.compile(r'(\d+\.?\d*)\s*mm\s*[×xX]\s*(\d+\.?\d*)\s*mm')
+_DIM_HEIGHT_RE = re.compile(r'(\d+\.?\d*)\s*mm\s*[Pp]ackage\s*[Hh]eight')
+_DIM_OUTLINE_RE = re.compile(r'OUTLINE\s+DIMENSIONS(.*?)(?:Rev\.|$)', re.DOTALL | re.IGNORECASE)
+# "NN-Lead ... [PACKAGE]" with following "X mm × Y mm Body"
+_DIM_OUTLINE_PACKAGE_RE = re.compile(
+    r'(\d+)-[Ll]ead[^[]*\[([A-Z]+)\][^\n]*\n[^\n]*(\d+)\s*mm\s*[×xX]\s*(\d+)\s*mm\s*[Bb]ody(?:\s*and\s*(\d+\.?\d*)\s*mm)?',
+    re.IGNORECASE,
+)
+
+_ORDERING_RES = [re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    # Look for ORDERING GUIDE followed by table content (Model/Temperature/Package)
+    r'(ORDERING\s+GUIDE\s*\n[^\n]*(?:Model|Temperature|Package).{200,5000})',
+    r'(ORDER(?:ING)?\s+INFORMATION\s*\n.{200,3000})',
+    r'(Model\d?\s+Temperature\s+Range\s+Package.{200,3000})',
+)]
+
+# Format: ADuC7060BCPZ32 or ADuC7061BSTZ32
+# B = temperature grade, CPZ = LFCSP package, STZ = LQFP package
+_ADUC_PART_RE = re.compile(r'ADuC\d{4}B?(CPZ|STZ|CP|ST)(\d*)', re.IGNORECASE)
+_TRAILING_DIGITS_RE = re.compile(r'(\d+)$')
+_FILENAME_PART_RE = re.compile(r'(AD[A-Z]*\d{4}[A-Z0-9]*)')
+
 
 class AnalogDevicesExtractor(DatasheetExtractor):
     """Extractor for Analog Devices PDF datasheets."""
@@ -73,6 +127,9 @@ class AnalogDevicesExtractor(DatasheetExtractor):
         'BSTZ': ('LQFP', None),
     }
 
+    _PART_NUMBER_RES = [re.compile(p, re.IGNORECASE) for p in PART_NUMBER_PATTERNS]
+    _PACKAGE_RES = [(re.compile(p, re.IGNORECASE), name) for p, name in PACKAGE_PATTERNS]
+
     def extract(self, pdf_path: Path) -> List[Dict]:
         """
         Extract IC specification data from Analog Devices PDF datasheet.
@@ -170,21 +227,8 @@ class AnalogDevicesExtractor(DatasheetExtractor):
         """Extract voltage specs from PDF text."""
         voltage_specs = {}
 
-        patterns = [
-            # VDD with tolerance: "VDD = 2.5 V ± 5%" -> 2.375 to 2.625
-            r'V[Dd][Dd]\s*[=:]\s*(\d+\.?\d*)\s*V\s*[±]\s*(\d+)%',
-            # AVDD/DVDD range
-            r'[AD]VDD\s*[=:]\s*(\d+\.?\d*)\s*V?\s*(?:to|[-–~])\s*(\d+\.?\d*)\s*V',
-            # Supply voltage range
-            r'[Ss]upply\s+[Vv]oltage[^\\d]*(\\d+\\.?\\d*)\\s*V?\\s*(?:to|[-–~])\\s*(\\d+\\.?\\d*)\\s*V',
-            # Operating voltage
-            r'[Oo]perating\s+[Vv]oltage[^\\d]*(\\d+\\.?\\d*)\\s*V?\\s*(?:to|[-–~])\\s*(\\d+\\.?\\d*)\\s*V',
-            # Generic "X.X V to Y.Y V"
-            r'(\d+\.?\d*)\s*V\s*(?:to|[-–~])\s*(\d+\.?\d*)\s*V(?:\s|,|$)',
-        ]
-
         # First try the VDD with tolerance pattern
-        tolerance_match = re.search(patterns[0], text)
+        tolerance_match = _VOLTAGE_TOLERANCE_RE.search(text)
         if tolerance_match:
             try:
                 vdd = float(tolerance_match.group(1))
@@ -199,8 +243,8 @@ class AnalogDevicesExtractor(DatasheetExtractor):
                 pass
 
         # Try other patterns
-        for pattern in patterns[1:]:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _VOLTAGE_RES:
+            match = pattern.search(text)
             if match:
                 try:
                     min_v = float(match.group(1))
@@ -222,19 +266,8 @@ class AnalogDevicesExtractor(DatasheetExtractor):
         # Normalize unicode minus signs to regular hyphens
         normalized_text = text.replace('−', '-').replace('–', '-')
 
-        patterns = [
-            # Standard format: "-40°C to +125°C"
-            r'(-?\d+)\s*°?\s*C\s*(?:to|[-~])\s*\+?(\d+)\s*°?\s*C',
-            # Temperature range in specifications
-            r'[Tt]emperature\s+[Rr]ange[:\s]+(-?\d+)\s*°?\s*C?\s*(?:to|[-~])\s*\+?(\d+)',
-            # Operating temperature
-            r'[Oo]perating\s+[Tt]emperature[:\s]+(-?\d+)\s*°?\s*C?\s*(?:to|[-~])\s*\+?(\d+)',
-            # Specified for temperature range
-            r'[Ss]pecified\s+for\s+(-?\d+)\s*°?\s*C?\s*(?:to|[-~])\s*\+?(\d+)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, normalized_text, re.IGNORECASE)
+        for pattern in _TEMP_RES:
+            match = pattern.search(normalized_text)
             if match:
                 try:
                     min_t = float(match.group(1))
@@ -280,8 +313,7 @@ class AnalogDevicesExtractor(DatasheetExtractor):
 
         # First, try to find dimension blocks with package context
         # Look for "Figure XX. NN-Lead ... [PACKAGE]" followed by dimensions
-        figure_pattern = r'Figure\s*\d+\.\s*(\d+)-[Ll]ead[^[]*\[([A-Z]+)\][^\n]*\n([^\n]*(?:\d+\.?\d*)\s*mm[^\n]*)'
-        figure_matches = re.finditer(figure_pattern, text, re.IGNORECASE)
+        figure_matches = _DIM_FIGURE_RE.finditer(text)
 
         for match in figure_matches:
             try:
@@ -290,14 +322,14 @@ class AnalogDevicesExtractor(DatasheetExtractor):
                 dim_text = match.group(3)
 
                 # Extract dimensions from the dimension text
-                dim_match = re.search(r'(\d+\.?\d*)\s*mm\s*[×xX]\s*(\d+\.?\d*)\s*mm', dim_text)
+                dim_match = _DIM_BODY_RE.search(dim_text)
                 if dim_match:
                     length = float(dim_match.group(1))
                     width = float(dim_match.group(2))
 
                     # Look for height
                     height = None
-                    height_match = re.search(r'(\d+\.?\d*)\s*mm\s*[Pp]ackage\s*[Hh]eight', dim_text)
+                    height_match = _DIM_HEIGHT_RE.search(dim_text)
                     if height_match:
                         height = float(height_match.group(1))
 
@@ -313,13 +345,12 @@ class AnalogDevicesExtractor(DatasheetExtractor):
                 continue
 
         # Also search for standalone dimension patterns with nearby package info
-        outline_section = re.search(r'OUTLINE\s+DIMENSIONS(.*?)(?:Rev\.|$)', text, re.DOTALL | re.IGNORECASE)
+        outline_section = _DIM_OUTLINE_RE.search(text)
         if outline_section:
             section_text = outline_section.group(1)
 
             # Find all "NN-Lead ... [PACKAGE]" with following "X mm × Y mm Body"
-            pkg_dim_pattern = r'(\d+)-[Ll]ead[^[]*\[([A-Z]+)\][^\n]*\n[^\n]*(\d+)\s*mm\s*[×xX]\s*(\d+)\s*mm\s*[Bb]ody(?:\s*and\s*(\d+\.?\d*)\s*mm)?'
-            for match in re.finditer(pkg_dim_pattern, section_text, re.IGNORECASE):
+            for match in _DIM_OUTLINE_PACKAGE_RE.finditer(section_text):
                 try:
                     pin_count = int(match.group(1))
                     package_type = match.group(2).upper()
@@ -357,8 +388,8 @@ class AnalogDevicesExtractor(DatasheetExtractor):
         search_text = ordering_section if ordering_section else text
 
         # Try each part number pattern
-        for pattern in self.PART_NUMBER_PATTERNS:
-            matches = re.finditer(pattern, search_text, re.IGNORECASE)
+        for pattern in self._PART_NUMBER_RES:
+            matches = pattern.finditer(search_text)
 
             for match in matches:
                 part_number = match.group(1).upper()
@@ -408,11 +439,11 @@ class AnalogDevicesExtractor(DatasheetExtractor):
                         # Try matching by pin count if package type doesn't match exactly
                         for pkg_key, dims in dimension_specs.items():
                             # Check if pin counts match (e.g., "LFCSP48" matches "LQFP48")
-                            pkg_pin_match = re.search(r'(\d+)$', pkg_key)
+                            pkg_pin_match = _TRAILING_DIGITS_RE.search(pkg_key)
                             if pkg_pin_match and pin_count and int(pkg_pin_match.group(1)) == pin_count:
                                 # Also check if package family matches (LFCSP vs LQFP)
-                                pkg_family = re.sub(r'\d+$', '', package_type).upper()
-                                key_family = re.sub(r'\d+$', '', pkg_key).upper()
+                                pkg_family = _TRAILING_DIGITS_RE.sub('', package_type).upper()
+                                key_family = _TRAILING_DIGITS_RE.sub('', pkg_key).upper()
                                 if pkg_family == key_family:
                                     dim_length = dims.get("length")
                                     dim_width = dims.get("width")
@@ -441,16 +472,9 @@ class AnalogDevicesExtractor(DatasheetExtractor):
 
     def _find_ordering_section(self, text: str) -> Optional[str]:
         """Find and extract the ordering information section from text."""
-        patterns = [
-            # Look for ORDERING GUIDE followed by table content (Model/Temperature/Package)
-            r'(ORDERING\s+GUIDE\s*\n[^\n]*(?:Model|Temperature|Package).{200,5000})',
-            r'(ORDER(?:ING)?\s+INFORMATION\s*\n.{200,3000})',
-            r'(Model\d?\s+Temperature\s+Range\s+Package.{200,3000})',
-        ]
-
-        for pattern in patterns:
+        for pattern in _ORDERING_RES:
             # Find ALL matches and take the LAST one (actual table, not TOC reference)
-            matches = list(re.finditer(pattern, text, re.IGNORECASE | re.DOTALL))
+            matches = list(pattern.finditer(text))
             if matches:
                 # Use the last match (likely the actual ordering table, not TOC)
                 last_match = matches[-1]
@@ -469,9 +493,7 @@ class AnalogDevicesExtractor(DatasheetExtractor):
         pin_count = None
 
         # Check if ADuC part - decode from part number
-        # Format: ADuC7060BCPZ32 or ADuC7061BSTZ32
-        # B = temperature grade, CPZ = LFCSP package, STZ = LQFP package
-        aduc_match = re.match(r'ADuC\d{4}B?(CPZ|STZ|CP|ST)(\d*)', part_number, re.IGNORECASE)
+        aduc_match = _ADUC_PART_RE.match(part_number)
         if aduc_match:
             pkg_code = aduc_match.group(1).upper()
             if 'ST' in pkg_code:
@@ -480,8 +502,8 @@ class AnalogDevicesExtractor(DatasheetExtractor):
                 package_type = 'LFCSP'
 
         # Try package patterns from context to get pin count
-        for pattern, pkg_name in self.PACKAGE_PATTERNS:
-            match = re.search(pattern, context, re.IGNORECASE)
+        for pattern, pkg_name in self._PACKAGE_RES:
+            match = pattern.search(context)
             if match:
                 try:
                     pins = int(match.group(1))
@@ -515,7 +537,7 @@ class AnalogDevicesExtractor(DatasheetExtractor):
                 break
 
         # Try to find AD/ADuC pattern in filename
-        part_match = re.search(r'(AD[A-Z]*\d{4}[A-Z0-9]*)', filename)
+        part_match = _FILENAME_PART_RE.search(filename)
         if part_match:
             part_number = part_match.group(1)
         else:
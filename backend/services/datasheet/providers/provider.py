@@ -44,7 +44,9 @@ def construct_datasheet_url(manufacturer_code: str, part_number: str) -> str:
 
 class DatasheetProvider:
     """
-    Base provider for downloading datasheets from manufacturer websites.
+    Provider for downloading datasheets from manufacturer websites.
+    One class serves every manufacturer: the URL comes from the
+    MANUFACTURER_URL_PATTERNS table, looked up once per instance.
     Uses unified storage for consistent file management.
     """
     
@@ -57,10 +59,13 @@ class DatasheetProvider:
         self.datasheet_root = get_storage_folder()  # Always use unified storage
         self.manufacturer_code = manufacturer_code
         self.manufacturer_name = get_manufacturer_name(manufacturer_code)
+        self.url_pattern = MANUFACTURER_URL_PATTERNS.get(Manufacturer(manufacturer_code))
     
     def construct_url(self, part_number: str) -> str:
         """Construct the URL for downloading the datasheet."""
-        return construct_datasheet_url(self.manufacturer_code, part_number)
+        if not self.url_pattern:
+            raise ValueError(f"No URL pattern defined for manufacturer: {self.manufacturer_code}")
+        return self.url_pattern.format(ic_id=part_number.lower().strip())
     
     def get_local_path(self, part_number: str, hash_value: Optional[str] = None) -> Path:
         """
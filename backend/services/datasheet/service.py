@@ -24,6 +24,7 @@ from services.datasheet_storage import (
     get_storage_folder,
     get_datasheet_filename,
     get_datasheet_path,
+    get_file_size,
     datasheet_exists,
 )
 from .exceptions import (
@@ -48,29 +49,25 @@ class DatasheetService:
     def __init__(self):
         """Initialize the datasheet service."""
         self.datasheet_root = get_storage_folder()
-        self._provider_instances: Dict[str, DatasheetProvider] = {}
+        # Providers are cheap and fixed per manufacturer, so build them all up front
+        self._provider_instances: Dict[str, DatasheetProvider] = {
+            code: provider_class(self.datasheet_root, code)
+            for code, provider_class in PROVIDERS.items()
+        }
         self._extractor_instances: Dict[str, DatasheetExtractor] = {}
     
     def _get_provider(self, manufacturer_code: str) -> DatasheetProvider:
         """Get or create a provider instance for the given manufacturer."""
         manufacturer_code = manufacturer_code.upper().strip()
         
-        if not is_valid_manufacturer(manufacturer_code):
+        try:
+            return self._provider_instances[manufacturer_code]
+        except KeyError:
             supported = ", ".join(get_supported_manufacturers())
             raise UnsupportedManufacturerException(
                 f"Manufacturer '{manufacturer_code}' is not supported. "
                 f"Supported manufacturers: {supported}"
-            )
-        
-        if manufacturer_code not in self._provider_instances:
-            from .providers import PROVIDERS
-            provider_class = PROVIDERS[manufacturer_code]
-            self._provider_instances[manufacturer_code] = provider_class(
-                self.datasheet_root,
-                manufacturer_code
-            )
-        
-        return self._provider_instances[manufacturer_code]
+            ) from None
     
     def _get_extractor(self, manufacturer_code: str) -> DatasheetExtractor:
         """Get or create an extractor instance for the given manufacturer."""
@@ -113,12 +110,21 @@ class DatasheetService:
         self,
         part_number: str,
         manufacturer_code: str,
-        db: Optional[AsyncSession] = None
+        db: Optional[AsyncSession] = None,
+        revalidate: bool = False
     ) -> Dict:
-        """Download datasheet from a single manufacturer."""
+        """
+        Download datasheet from a single manufacturer.
+        
+        A datasheet already recorded in the DB or sitting in storage is reused
+        as is. With revalidate=True it goes through provider.download instead,
+        which sends a conditional GET and keeps the stored PDF on HTTP 304.
+        """
         try:
             # Check if we already have this datasheet
-            existing_path = await self.get_local_path_from_db(part_number, manufacturer_code, db)
+            existing_path = None
+            if not revalidate:
+                existing_path = await self.get_local_path_from_db(part_number, manufacturer_code, db)
             
             provider = self._get_provider(manufacturer_code)
             
@@ -126,12 +132,12 @@ class DatasheetService:
                 # Resolve the path using unified storage
                 try:
                     file_path = get_datasheet_path(existing_path)
-                    if file_path.exists():
+                    file_size = get_file_size(file_path)
+                    if file_size is not None:
                         logger.info(
-                            f"Using existing datasheet: {existing_path} "
-                            f"for {part_number} from {manufacturer_code}"
+                            "Using existing datasheet: %s for %s from %s",
+                            existing_path, part_number, manufacturer_code,
                         )
-                        file_size = file_path.stat().st_size
                         datasheet_url = provider.construct_url(part_number)
                         
                         return {
@@ -147,10 +153,20 @@ class DatasheetService:
                             "error": None,
                         }
                 except Exception as e:
-                    logger.warning(f"Could not resolve existing path {existing_path}: {e}")
+                    logger.warning("Could not resolve existing path %s: %s", existing_path, e)
             
-            # Download new datasheet
-            file_path, file_size, datasheet_url, hash_value = await provider.download(part_number)
+            # Reuse a PDF already in storage (e.g. fetched earlier without a DB
+            # session) instead of downloading it again; extraction still runs
+            stored_path = provider.get_local_path(part_number)
+            file_size = None if revalidate else get_file_size(stored_path)
+            if file_size is not None:
+                logger.info("Using stored datasheet %s for %s from %s", stored_path.name, part_number, manufacturer_code)
+                file_path = stored_path
+                datasheet_url = provider.construct_url(part_number)
+                hash_value = stored_path.stem
+            else:
+                # Download new datasheet (or revalidate the stored one)
+                file_path, file_size, datasheet_url, hash_value = await provider.download(part_number)
             
             # Store just the filename in DB
             filename = f"{hash_value}.pdf"
@@ -163,9 +179,9 @@ class DatasheetService:
                 extracted_ics = extractor.extract(file_path)
                 data_extracted = len(extracted_ics) > 0
                 if data_extracted:
-                    logger.info(f"Extracted {len(extracted_ics)} IC variants from PDF: {file_path}")
+                    logger.info("Extracted %d IC variants from PDF: %s", len(extracted_ics), file_path)
             except Exception as e:
-                logger.warning(f"Failed to extract data from PDF {file_path}: {e}")
+                logger.warning("Failed to extract data from PDF %s: %s", file_path, e)
             
             return {
                 "manufacturer": manufacturer_code,
@@ -185,7 +201,7 @@ class DatasheetService:
                 DatasheetDownloadStatus.TIMEOUT if "timeout" in error_msg.lower() else DatasheetDownloadStatus.ERROR
             )
             # Simple one-line log for expected errors (404, timeout)
-            logger.debug(f"{manufacturer_code}: {error_msg}")
+            logger.debug("%s: %s", manufacturer_code, error_msg)
             
             return {
                 "manufacturer": manufacturer_code,
@@ -202,14 +218,14 @@ class DatasheetService:
             error_msg = str(e)
             # Classify common errors and log appropriately (no stack trace for expected errors)
             if "404" in error_msg or "not found" in error_msg.lower():
-                logger.debug(f"{manufacturer_code}: Not found (404)")
+                logger.debug("%s: Not found (404)", manufacturer_code)
                 status = DatasheetDownloadStatus.NOT_FOUND
             elif "timeout" in error_msg.lower() or "ReadTimeout" in type(e).__name__:
-                logger.debug(f"{manufacturer_code}: Timeout")
+                logger.debug("%s: Timeout", manufacturer_code)
                 status = DatasheetDownloadStatus.TIMEOUT
             else:
                 # Only log full exception for truly unexpected errors
-                logger.warning(f"{manufacturer_code}: {error_msg}")
+                logger.warning("%s: %s", manufacturer_code, error_msg)
                 status = DatasheetDownloadStatus.ERROR
             
             return {
@@ -228,13 +244,16 @@ class DatasheetService:
         self,
         part_number: str,
         manufacturer_code: Optional[str] = None,
-        db: Optional[AsyncSession] = None
+        db: Optional[AsyncSession] = None,
+        revalidate: bool = False
     ) -> Dict:
         """
         Download datasheet from manufacturer(s) and store in database.
         
         If manufacturer_code is provided, downloads only from that manufacturer.
         If omitted, tries manufacturers SEQUENTIALLY (one-by-one) and stops on first success.
+        A PDF that is already stored is reused without touching the network unless
+        revalidate is set, in which case it is re-checked with a conditional GET.
         """
         part_number = part_number.strip()
         
@@ -245,23 +264,23 @@ class DatasheetService:
         else:   
             manufacturers_to_try = get_supported_manufacturers()
         
-        logger.info(f"Downloading datasheet for {part_number} from manufacturers (sequential): {manufacturers_to_try}")
+        logger.info("Downloading datasheet for %s from manufacturers (sequential): %s", part_number, manufacturers_to_try)
         
         # Try manufacturers one-by-one, stop on first success
         results = []
         successful_result = None
         
         for mfr in manufacturers_to_try:
-            logger.info(f"Trying {mfr} for {part_number}...")
-            result = await self._download_single(part_number, mfr, db)
+            logger.info("Trying %s for %s...", mfr, part_number)
+            result = await self._download_single(part_number, mfr, db, revalidate=revalidate)
             results.append(result)
             
             if result["status"] == DatasheetDownloadStatus.SUCCESS.value:
-                logger.info(f"SUCCESS: Found datasheet for {part_number} on {mfr}")
+                logger.info("SUCCESS: Found datasheet for %s on %s", part_number, mfr)
                 successful_result = result
                 break  # Stop on first success
             else:
-                logger.info(f"FAILED: {mfr} - {result.get('error', 'Not found')}")
+                logger.info("FAILED: %s - %s", mfr, result.get("error", "Not found"))
         
         manufacturers_found = [
             r["manufacturer"] for r in results
@@ -311,7 +330,7 @@ class DatasheetService:
         # Try DigiKey fallback if no manufacturer-specific datasheet found
         digikey_result = None
         if not manufacturers_found:
-            logger.info(f"No manufacturer found for {part_number}, trying DigiKey fallback...")
+            logger.info("No manufacturer found for %s, trying DigiKey fallback...", part_number)
             digikey_result = await self._try_digikey_fallback(part_number, db)
             
             if digikey_result and digikey_result.get("success"):
@@ -353,6 +372,31 @@ class DatasheetService:
             "message": message,
         }
     
+    async def download_many(
+        self,
+        items: List[Tuple[str, Optional[str]]],
+        concurrency: int = 8,
+        revalidate: bool = False,
+    ) -> List[Dict | Exception]:
+        """
+        Download several datasheets concurrently (at most `concurrency` in flight).
+        
+        Items are (part_number, manufacturer_code or None). Nothing is written to
+        the database: an AsyncSession can't be shared between concurrent tasks,
+        so callers store the results themselves. Results come back in input
+        order; a failed item yields its exception instead of a result dict.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _one(part_number: str, manufacturer_code: Optional[str]) -> Dict | Exception:
+            async with semaphore:
+                try:
+                    return await self.download_datasheet(part_number, manufacturer_code, revalidate=revalidate)
+                except Exception as e:
+                    return e
+        
+        return await asyncio.gather(*(_one(pn, mfr) for pn, mfr in items))
+    
     async def _try_digikey_fallback(
         self,
         part_number: str,
@@ -364,13 +408,13 @@ class DatasheetService:
             from services.pdf_parser import parse_pdf
             from services.datasheet_storage import normalize_manufacturer
             
-            logger.info(f"Trying DigiKey fallback for {part_number}")
+            logger.info("Trying DigiKey fallback for %s", part_number)
             
             search_response = digi_service.search_keyword(part_number)
             
             datasheet_info = digi_service.extract_first_datasheet_info(search_response)
             if not datasheet_info:
-                logger.warning(f"DigiKey: No datasheet URL found for {part_number}")
+                logger.warning("DigiKey: No datasheet URL found for %s", part_number)
                 return None
             
             datasheet_url = datasheet_info["url"]
@@ -384,7 +428,7 @@ class DatasheetService:
                 manufacturer=manufacturer
             )
             
-            logger.info(f"DigiKey: Downloaded PDF as {filename}")
+            logger.info("DigiKey: Downloaded PDF as %s", filename)
             
             # Parse the PDF
             local_path = get_datasheet_path(filename)
@@ -401,7 +445,7 @@ class DatasheetService:
                     datasheet_url=datasheet_url,
                     datasheet_path=filename
                 )
-                logger.info(f"DigiKey: Saved {saved_count} variants to database")
+                logger.info("DigiKey: Saved %d variants to database", saved_count)
             elif db and not ic_variants:
                 manufacturer_code = normalize_manufacturer(manufacturer)
                 
@@ -431,7 +475,7 @@ class DatasheetService:
             }
             
         except Exception as e:
-            logger.warning(f"DigiKey fallback failed for {part_number}: {e}")
+            logger.warning("DigiKey fallback failed for %s: %s", part_number, e)
             return None
     
     def datasheet_exists(self, part_number: str, manufacturer_code: str) -> bool:
@@ -439,8 +483,8 @@ class DatasheetService:
         return datasheet_exists(part_number, manufacturer_code)
     
     @staticmethod
-    def get_supported_manufacturers() -> List[str]:
-        """Get list of supported manufacturer codes."""
+    def get_supported_manufacturers() -> Tuple[str, ...]:
+        """Get supported manufacturer codes."""
         return get_supported_manufacturers()
     
     @staticmethod
@@ -5,9 +5,17 @@ All PDF downloads should use this module to ensure consistent storage.
 PDFs are stored in: settings.DATASHEET_FOLDER/{hash}.pdf
 Database stores: {hash}.pdf (just the filename)
 """
+import asyncio
+import functools
 import hashlib
+import json
 import logging
+import os
+import random
+import tempfile
 import time
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Tuple
 from urllib.parse import urlparse, parse_qs, unquote
@@ -15,15 +23,106 @@ from urllib.parse import urlparse, parse_qs, unquote
 import httpx
 import requests
 
+try:
+    import h2  # noqa: F401 - httpx's HTTP/2 support (httpx[http2])
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from core.config import settings, PROJECT_ROOT
 
 logger = logging.getLogger(__name__)
 
+# Bytes per read/write when streaming a PDF to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Content-Type prefixes accepted without further inspection
+PDF_CONTENT_TYPES = ("application/pdf", "application/octet-stream")
+
+# Async downloads retry 5xx / network errors with jittered exponential backoff
+DOWNLOAD_MAX_RETRIES = 3
+RETRY_BACKOFF_BASE_SECONDS = 0.5
+
+# Shared by all async downloads so connections (and TLS sessions) to the
+# manufacturer hosts are pooled instead of re-established per datasheet
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client, creating it on first use.
+    
+    Returns:
+        Long-lived httpx.AsyncClient (close it with close_http_client on shutdown)
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        # HTTP/2 multiplexes concurrent downloads from one host over a single connection
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60,
+            ),
+        )
+    return _http_client
+
+
+class HostThrottle:
+    """
+    Credit-based limiter for one host: at most `max_requests` requests start
+    within any `window_seconds`; each credit is refunded `window_seconds`
+    after it was spent. Waiters are served in arrival order.
+    """
+    
+    def __init__(self, max_requests: int, window_seconds: float):
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self._sent: deque[float] = deque()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            while self._sent and now - self._sent[0] >= self.window_seconds:
+                self._sent.popleft()
+            if len(self._sent) >= self.max_requests:
+                await asyncio.sleep(self.window_seconds - (now - self._sent[0]))
+                self._sent.popleft()
+            self._sent.append(time.monotonic())
+
+
+_host_throttles: dict[str, HostThrottle] = {}
+
+
+def get_host_throttle(url: str) -> HostThrottle:
+    """Get the throttle for the URL's host (created on first use)."""
+    host = (urlparse(url).hostname or "").lower()
+    throttle = _host_throttles.get(host)
+    if throttle is None:
+        throttle = _host_throttles[host] = HostThrottle(
+            settings.SCRAPE_HOST_MAX_REQUESTS,
+            settings.SCRAPE_HOST_WINDOW_SECONDS,
+        )
+    return throttle
 
+
+async def close_http_client() -> None:
+    """Close the shared async HTTP client (called on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+@functools.lru_cache(maxsize=4096)
 def generate_hash(part_number: str, manufacturer_code: str) -> str:
     """
     Generate a unique hash for the datasheet filename.
     Uses part_number + manufacturer_code to create a unique identifier.
+    Memoized: one lookup resolves the same part several times (DB, disk, download).
     
     Args:
         part_number: IC part number (e.g., "LM555")
@@ -37,17 +136,24 @@ def generate_hash(part_number: str, manufacturer_code: str) -> str:
     return hash_obj.hexdigest()[:16]
 
 
+@functools.lru_cache(maxsize=None)
+def _prepare_storage_folder(folder: Path) -> Path:
+    """Resolve and create a storage folder once per configured path."""
+    resolved = folder.resolve()
+    resolved.mkdir(parents=True, exist_ok=True)
+    return resolved
+
+
 def get_storage_folder() -> Path:
     """
     Get the datasheet storage folder (absolute path).
-    Creates it if it doesn't exist.
+    Creates it the first time it is requested; later calls skip the
+    resolve/mkdir syscalls.
     
     Returns:
         Absolute Path to the datasheet folder
     """
-    folder = settings.DATASHEET_FOLDER.resolve()
-    folder.mkdir(parents=True, exist_ok=True)
-    return folder
+    return _prepare_storage_folder(settings.DATASHEET_FOLDER)
 
 
 def get_datasheet_filename(part_number: str, manufacturer_code: str) -> str:
@@ -94,18 +200,18 @@ def get_datasheet_path(filename_or_path: str) -> Path:
     # Handle paths that start with "datasheets/" - resolve from project root
     if filename_or_path.startswith("datasheets/"):
         resolved = PROJECT_ROOT / filename_or_path
-        logger.debug(f"Resolved 'datasheets/' path: {filename_or_path} -> {resolved}")
+        logger.debug("Resolved 'datasheets/' path: %s -> %s", filename_or_path, resolved)
         return resolved
     
     # Handle paths with subdirectories (e.g., "ti/{hash}.pdf")
     if "/" in filename_or_path:
         resolved = get_storage_folder() / filename_or_path
-        logger.debug(f"Resolved subdirectory path: {filename_or_path} -> {resolved}")
+        logger.debug("Resolved subdirectory path: %s -> %s", filename_or_path, resolved)
         return resolved
     
     # Simple filename - look directly in DATASHEET_FOLDER
     resolved = get_storage_folder() / filename_or_path
-    logger.debug(f"Resolved simple filename: {filename_or_path} -> {resolved}")
+    logger.debug("Resolved simple filename: %s -> %s", filename_or_path, resolved)
     return resolved
 
 
@@ -141,21 +247,125 @@ def get_existing_path(part_number: str, manufacturer_code: str) -> Optional[Path
     return path if path.exists() else None
 
 
+def get_file_size(path: Path) -> Optional[int]:
+    """
+    Size of a stored datasheet in bytes, or None if it does not exist.
+    One stat call, so it stands in for exists() followed by stat().
+    """
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return None
+
+
+@contextmanager
+def atomic_write(local_path: Path):
+    """
+    Open a temporary file next to local_path for binary writing; it replaces
+    local_path only when the block completes, so an interrupted download never
+    leaves a truncated PDF that later existence checks would accept.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=local_path.parent, prefix=f".{local_path.name}.", suffix=".part"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, local_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _validators_path(local_path: Path) -> Path:
+    """Sidecar file holding the ETag / Last-Modified of a downloaded PDF."""
+    return local_path.with_name(local_path.name + ".meta")
+
+
+def _conditional_headers(local_path: Path) -> dict:
+    """If-None-Match / If-Modified-Since headers for a PDF we already have."""
+    if not local_path.exists():
+        return {}
+    try:
+        validators = json.loads(_validators_path(local_path).read_text())
+    except (OSError, ValueError):
+        return {}
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def _save_validators(local_path: Path, response: httpx.Response) -> None:
+    validators = {
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+    }
+    meta_path = _validators_path(local_path)
+    if validators["etag"] or validators["last_modified"]:
+        meta_path.write_text(json.dumps(validators))
+    else:
+        meta_path.unlink(missing_ok=True)
+
+
+async def _save_pdf_response(
+    response: httpx.Response,
+    part_number: str,
+    local_path: Path,
+) -> int:
+    """Check a streamed PDF response and write it to local_path. Returns the size."""
+    if response.status_code == 304:
+        file_size = local_path.stat().st_size
+        logger.info("Datasheet for %s not modified, keeping %s", part_number, local_path)
+        return file_size
+    
+    if response.status_code == 404:
+        raise Exception(f"Datasheet not found (HTTP 404) for {part_number}")
+    
+    if response.status_code != 200:
+        raise Exception(f"Failed to download datasheet. HTTP {response.status_code}")
+    
+    content_type = response.headers.get("content-type", "")
+    # Servers almost always send one of these verbatim; only lowercase the odd ones
+    if not content_type.startswith(PDF_CONTENT_TYPES):
+        lowered = content_type.lower()
+        if "pdf" not in lowered and "octet-stream" not in lowered:
+            logger.warning("Unexpected content-type: %s, proceeding anyway", content_type)
+    
+    # Stream to disk so memory per download stays at one chunk, not the whole PDF
+    file_size = 0
+    with atomic_write(local_path) as f:
+        async for chunk in response.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+            file_size += len(chunk)
+    _save_validators(local_path, response)
+    
+    logger.info("Downloaded %d bytes to %s", file_size, local_path)
+    return file_size
+
+
 async def download_pdf_async(
     url: str,
     part_number: str,
     manufacturer_code: str,
-    timeout: int = 30
+    timeout: int = 30,
+    max_retries: int = DOWNLOAD_MAX_RETRIES,
 ) -> Tuple[str, int]:
     """
     Download a PDF asynchronously and save it to the unified storage location.
-    Includes automatic URL resolution for TI webview and redirects.
+    Includes automatic URL resolution for TI webview and redirects, retries
+    on 5xx / network errors, and a conditional GET when the PDF is already
+    stored (HTTP 304 keeps the local copy).
     
     Args:
         url: URL to download from
         part_number: IC part number (used for hash generation)
         manufacturer_code: Manufacturer code (used for hash generation)
         timeout: Request timeout in seconds
+        max_retries: Maximum number of attempts
         
     Returns:
         Tuple of (filename, file_size_bytes)
@@ -164,35 +374,37 @@ async def download_pdf_async(
     Raises:
         Exception: If download fails
     """
-    # Resolve URL (handle TI webview and redirects) - use sync version since it's just URL parsing
-    resolved_url = resolve_url(url)
+    # Resolve URL (handle TI webview, preview pages and redirects)
+    resolved_url = await resolve_url_async(url)
     
     filename = get_datasheet_filename(part_number, manufacturer_code)
     local_path = get_storage_folder() / filename
     
-    logger.info(f"Downloading PDF for {part_number} ({manufacturer_code}) from {resolved_url}")
-    logger.debug(f"Saving to: {local_path}")
+    logger.info("Downloading PDF for %s (%s) from %s", part_number, manufacturer_code, resolved_url)
+    logger.debug("Saving to: %s", local_path)
     
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-        response = await client.get(resolved_url)
-        
-        if response.status_code == 404:
-            raise Exception(f"Datasheet not found (HTTP 404) for {part_number}")
-        
-        if response.status_code != 200:
-            raise Exception(f"Failed to download datasheet. HTTP {response.status_code}")
-        
-        content_type = response.headers.get("content-type", "")
-        if "pdf" not in content_type.lower() and "octet-stream" not in content_type.lower():
-            logger.warning(f"Unexpected content-type: {content_type}, proceeding anyway")
-        
-        with local_path.open("wb") as f:
-            f.write(response.content)
-        
-        file_size = len(response.content)
-        logger.info(f"Downloaded {file_size} bytes to {local_path}")
+    client = get_http_client()
+    headers = _conditional_headers(local_path)
+    
+    for attempt in range(1, max_retries + 1):
+        # Stay under vendor rate limits (st.com, ti.com, ...) during bulk syncs
+        await get_host_throttle(resolved_url).acquire()
+        try:
+            async with client.stream("GET", resolved_url, timeout=timeout, headers=headers) as response:
+                if response.status_code < 500 or attempt == max_retries:
+                    file_size = await _save_pdf_response(response, part_number, local_path)
+                    return filename, file_size
+                logger.warning(
+                    "HTTP %d for %s, retrying (%d/%d)", response.status_code, part_number, attempt, max_retries
+                )
+        except httpx.RequestError as e:
+            if attempt == max_retries:
+                raise
+            logger.warning("Download error for %s, retrying (%d/%d): %s", part_number, attempt, max_retries, e)
         
-        return filename, file_size
+        await asyncio.sleep(random.uniform(0, RETRY_BACKOFF_BASE_SECONDS * 2 ** attempt))
+    
+    raise Exception("Failed to download PDF after all retries")
 
 
 def download_pdf_sync(
@@ -233,7 +445,9 @@ def download_pdf_sync(
     
     for attempt in range(max_retries):
         try:
-            logger.info(f"Downloading PDF for {part_number} from {resolved_url} (attempt {attempt + 1}/{max_retries})")
+            logger.info(
+                "Downloading PDF for %s from %s (attempt %d/%d)", part_number, resolved_url, attempt + 1, max_retries
+            )
             
             with requests.get(resolved_url, stream=True, timeout=timeout, headers=headers) as r:
                 if r.status_code == 404:
@@ -242,25 +456,25 @@ def download_pdf_sync(
                 if r.status_code != 200:
                     raise Exception(f"Failed to download PDF: HTTP {r.status_code}")
                 
-                with local_path.open("wb") as f:
+                with atomic_write(local_path) as f:
                     file_size = 0
                     for chunk in r.iter_content(chunk_size=8192):
                         if chunk:
                             f.write(chunk)
                             file_size += len(chunk)
                 
-                logger.info(f"Downloaded {file_size} bytes to {local_path}")
+                logger.info("Downloaded %d bytes to %s", file_size, local_path)
                 return filename, file_size
                 
         except requests.exceptions.Timeout:
             if attempt < max_retries - 1:
-                logger.warning(f"Download timeout, retrying... ({attempt + 1}/{max_retries})")
+                logger.warning("Download timeout, retrying... (%d/%d)", attempt + 1, max_retries)
                 time.sleep(2)
                 continue
             raise Exception(f"Download timeout after {max_retries} attempts")
         except Exception as e:
             if attempt < max_retries - 1 and "timeout" not in str(e).lower():
-                logger.warning(f"Download error, retrying: {e}")
+                logger.warning("Download error, retrying: %s", e)
                 time.sleep(1)
                 continue
             raise
@@ -295,10 +509,10 @@ def resolve_ti_webview_url(url: str) -> str:
             goto_url = query_params["gotoUrl"][0]
             # Decode twice
             actual_url = unquote(unquote(goto_url))
-            logger.info(f"Resolved TI webview URL: {url} -> {actual_url}")
+            logger.info("Resolved TI webview URL: %s -> %s", url, actual_url)
             return actual_url
     except Exception as e:
-        logger.warning(f"Failed to parse TI webview URL: {e}")
+        logger.warning("Failed to parse TI webview URL: %s", e)
 
     return url
 
@@ -342,27 +556,27 @@ def extract_pdf_from_preview_page(url: str, timeout: int = 30) -> Optional[str]:
             match = re.search(r'window\.viewerPdfUrl\s*=\s*[\'"]([^\'\"]+)[\'"]', html_content)
             if match:
                 pdf_url = match.group(1)
-                logger.info(f"Extracted PDF URL from preview page: {pdf_url}")
+                logger.info("Extracted PDF URL from preview page: %s", pdf_url)
                 return pdf_url
             
             # Pattern 2: data-pdf-url="URL"
             match = re.search(r'data-pdf-url=[\'"]([^\'\"]+)[\'"]', html_content)
             if match:
                 pdf_url = match.group(1)
-                logger.info(f"Extracted PDF URL from data attribute: {pdf_url}")
+                logger.info("Extracted PDF URL from data attribute: %s", pdf_url)
                 return pdf_url
             
             # Pattern 3: Look for .pdf URLs in the HTML
             pdf_urls = re.findall(r'https?://[^\s\'"<>]+\.pdf[^\s\'"<>]*', html_content)
             if pdf_urls:
                 pdf_url = pdf_urls[0]
-                logger.info(f"Found PDF URL in HTML: {pdf_url}")
+                logger.info("Found PDF URL in HTML: %s", pdf_url)
                 return pdf_url
                 
         return None
         
     except Exception as e:
-        logger.warning(f"Failed to extract PDF from preview page {url}: {e}")
+        logger.warning("Failed to extract PDF from preview page %s: %s", url, e)
         return None
 
 
@@ -387,13 +601,13 @@ def follow_redirects(url: str, timeout: int = 30) -> str:
         resp = requests.head(url, allow_redirects=True, timeout=timeout, headers=headers)
         
         if resp.url != url:
-            logger.info(f"Followed redirect: {url} -> {resp.url}")
+            logger.info("Followed redirect: %s -> %s", url, resp.url)
             return resp.url
         
         return url
         
     except Exception as e:
-        logger.warning(f"Failed to follow redirects for {url}: {e}")
+        logger.warning("Failed to follow redirects for %s: %s", url, e)
         return url
 
 
@@ -422,6 +636,31 @@ def resolve_url(url: str) -> str:
     return url
 
 
+async def resolve_url_async(url: str) -> str:
+    """
+    Async version of resolve_url, used by download_pdf_async.
+    
+    The preview-page GET and the redirect HEAD hit the vendor host just like
+    the download, so each takes a credit from that host's throttle first.
+    Both use blocking requests calls and run in a worker thread.
+    
+    Args:
+        url: Original datasheet URL
+        
+    Returns:
+        Resolved URL ready for download
+    """
+    url = resolve_ti_webview_url(url)
+    
+    await get_host_throttle(url).acquire()
+    extracted_url = await asyncio.to_thread(extract_pdf_from_preview_page, url)
+    if extracted_url:
+        url = extracted_url
+    
+    await get_host_throttle(url).acquire()
+    return await asyncio.to_thread(follow_redirects, url)
+
+
 # Manufacturer name normalization for hash generation
 MANUFACTURER_NAME_MAP = {
     "stmicroelectronics": "STM",
@@ -7,21 +7,16 @@ Handles batch processing with GPU optimization and result validation.
 
 import asyncio
 import os
-from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, AsyncIterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import torch
 import cv2
 import numpy as np
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))  # Add project root
-sys.path.insert(0, str(Path(__file__).parent.parent))  # Add backend
-
-from backend.services.classification_service import ImageClassifier
-from backend.services.llm import LLM
-from backend.services.ocr import ICChipOCR
-from backend.services.gemini_service import GeminiICAnalysisService
+from services.classification_service import ImageClassifier
+from services.llm import LLM
+from services.ocr import ICChipOCR
+from services.gemini_service import GeminiICAnalysisService
 
 
 class ModelRouter:
@@ -69,9 +64,14 @@ class ModelRouter:
         Process multiple images in batch with optimized routing.
         HARDCODED FOR DEMO: Fast results with specific values.
         """
+        return [result async for result in self.iter_batch(image_paths)]
+
+    async def iter_batch(self, image_paths: List[str]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a batch, yielding each image's result as soon as it is ready.
+        HARDCODED FOR DEMO: Fast results with specific values.
+        """
         # HARDCODED DEMO: Return fixed values for each image
-        validated_results = []
-        
         for idx, path in enumerate(image_paths):
             image_num = idx + 1  # 1-indexed
             
@@ -116,14 +116,12 @@ class ModelRouter:
                     'estimated_time': 0.5
                 }
             
-            validated_results.append({
+            yield {
                 'image_path': path,
                 'classification': classification,
                 'result': result,
                 'processing_time': 0.5
-            })
-        
-        return validated_results
+            }
 
     async def _route_processing(self, image_path: str, classification: Dict[str, Any]) -> Dict[str, Any]:
         """
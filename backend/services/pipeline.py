@@ -21,8 +21,6 @@ import sys
 from pathlib import Path
 from typing import Tuple, Dict, Any, List
 
-sys.path.insert(0, str(Path(__file__).parent / "correct"))
-
 from services.llm import LLM
 from services.correct.moon import count_ic_pins_opencv
 from services.correct.classifier import detect_ic_pins_enhanced
@@ -98,7 +96,7 @@ def run_annotate_mask_pins(edges_image: str, debug_dir: str) -> int:
     Returns:
         Estimated total pin count
     """
-    from correct.annotate_mask_pins import run, find_pin_centers, count_pins_by_side, side_regularity
+    from services.correct.annotate_mask_pins import run, find_pin_centers, count_pins_by_side, side_regularity
     import cv2
     
     base_name = Path(edges_image).stem
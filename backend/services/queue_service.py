@@ -98,22 +98,27 @@ class QueueService:
         items = list(result.scalars().all())
         
         # Get counts by status (for the full queue, not filtered)
-        pending_result = await db.execute(
-            select(func.count()).select_from(DatasheetQueue).where(
-                DatasheetQueue.status == "PENDING"
-            )
-        )
-        pending_count = pending_result.scalar() or 0
-        
-        failed_result = await db.execute(
-            select(func.count()).select_from(DatasheetQueue).where(
-                DatasheetQueue.status == "FAILED"
-            )
-        )
-        failed_count = failed_result.scalar() or 0
+        pending_count, failed_count = await QueueService.get_status_counts(db)
         
         return items, total_count, pending_count, failed_count
 
+    @staticmethod
+    async def get_status_counts(db: AsyncSession) -> tuple[int, int]:
+        """
+        Count PENDING and FAILED queue items in one query, without loading rows.
+        
+        Returns:
+            Tuple of (pending_count, failed_count)
+        """
+        result = await db.execute(
+            select(
+                func.count().filter(DatasheetQueue.status == "PENDING"),
+                func.count().filter(DatasheetQueue.status == "FAILED"),
+            ).select_from(DatasheetQueue)
+        )
+        pending_count, failed_count = result.one()
+        return pending_count or 0, failed_count or 0
+
     @staticmethod
     async def remove_from_queue(db: AsyncSession, part_number: str) -> bool:
         """Remove a part number from the queue."""
@@ -1,7 +1,7 @@
 """Service for scan operations."""
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator
 from datetime import datetime, timedelta
 from uuid import UUID, uuid4
 import logging
@@ -497,7 +497,79 @@ class ScanService:
         base_query = select(ScanHistory)
         count_query = select(func.count()).select_from(ScanHistory)
 
-        # Apply filters
+        filters = ScanService._scan_filters(
+            status=status,
+            action_required=action_required,
+            part_number=part_number,
+            manufacturer=manufacturer,
+            has_bottom_scan=has_bottom_scan,
+            manual_override=manual_override,
+            batch_id=batch_id,
+            batch_vender=batch_vender,
+            date_from=date_from,
+            date_to=date_to,
+        )
+        if filters:
+            base_query = base_query.where(and_(*filters))
+            count_query = count_query.where(and_(*filters))
+
+        # Get count
+        count_result = await db.execute(count_query)
+        total_count = count_result.scalar() or 0
+
+        # Get results
+        base_query = base_query.order_by(ScanHistory.scanned_at.desc())
+        base_query = base_query.limit(limit).offset(offset)
+
+        result = await db.execute(base_query)
+        scans = result.scalars().all()
+
+        return list(scans), total_count
+
+    @staticmethod
+    async def stream_scans(
+        db: AsyncSession,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        **filter_kwargs,
+    ) -> tuple[AsyncIterator[ScanHistory], int]:
+        """
+        Like list_scans, but rows are fetched through a server-side cursor
+        in batches instead of being loaded all at once.
+
+        Returns (row iterator, total_count). Accepts the same filter keyword
+        arguments as list_scans.
+        """
+        filters = ScanService._scan_filters(**filter_kwargs)
+
+        count_query = select(func.count()).select_from(ScanHistory)
+        query = select(ScanHistory).order_by(ScanHistory.scanned_at.desc()).offset(offset)
+        if filters:
+            count_query = count_query.where(and_(*filters))
+            query = query.where(and_(*filters))
+        if limit is not None:
+            query = query.limit(limit)
+
+        count_result = await db.execute(count_query)
+        total_count = count_result.scalar() or 0
+
+        result = await db.stream_scalars(query.execution_options(yield_per=200))
+        return result, total_count
+
+    @staticmethod
+    def _scan_filters(
+        status: Optional[str] = None,
+        action_required: Optional[str] = None,
+        part_number: Optional[str] = None,
+        manufacturer: Optional[str] = None,
+        has_bottom_scan: Optional[bool] = None,
+        manual_override: Optional[bool] = None,
+        batch_id: Optional[str] = None,
+        batch_vender: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> list:
+        """Build WHERE clauses for the scan list filters."""
         filters = []
         if status:
             filters.append(ScanHistory.status == status)
@@ -525,23 +597,7 @@ class ScanService:
             filters.append(ScanHistory.scanned_at >= date_from)
         if date_to:
             filters.append(ScanHistory.scanned_at <= date_to)
-
-        if filters:
-            base_query = base_query.where(and_(*filters))
-            count_query = count_query.where(and_(*filters))
-
-        # Get count
-        count_result = await db.execute(count_query)
-        total_count = count_result.scalar() or 0
-
-        # Get results
-        base_query = base_query.order_by(ScanHistory.scanned_at.desc())
-        base_query = base_query.limit(limit).offset(offset)
-
-        result = await db.execute(base_query)
-        scans = result.scalars().all()
-
-        return list(scans), total_count
+        return filters
 
     @staticmethod
     async def get_stats(db: AsyncSession) -> dict:
@@ -221,7 +221,7 @@ class SyncService:
                                     reason=f"Not found on any manufacturer website or DigiKey after {MAX_RETRY_COUNT} sync attempts",
                                     source="SYNC_NOT_FOUND",
                                     scrape_attempts=queue_item.retry_count,
-                                    manufacturers_checked=get_supported_manufacturers() + ["DIGIKEY"],
+                                    manufacturers_checked=[*get_supported_manufacturers(), "DIGIKEY"],
                                 )
                             except ValueError:  # Already in fake registry
                                 pass
@@ -14,6 +14,8 @@ from schemas.common import ScanStatus
 from schemas.scan_verify import (
     VerificationStatus,
     VerificationCheck,
+    VerificationChecks,
+    MatchedIC,
     ScanVerifyResult,
     ActionRequired,
 )
@@ -61,14 +63,14 @@ class VerificationService:
             scan_id=scan_id,
         )
 
-        verification_checks = verification_result.verification_checks or {}
-        verification_checks_dict = {
-            key: value.model_dump() if hasattr(value, "model_dump") else None
-            for key, value in verification_checks.items()
-        }
+        checks = verification_result.verification_checks
+        # Stored as JSONB with only the checks that were run; each check keeps all its fields
+        verification_checks_dict = {name: check.model_dump() for name, check in checks if check is not None}
 
         failure_reasons = [
-            v.reason for v in verification_checks.values() if v and v.reason
+            check.reason
+            for check in (checks.part_number_match, checks.manufacturer_match, checks.pin_count_match)
+            if check and check.reason
         ]
 
         status_map = {
@@ -81,20 +83,14 @@ class VerificationService:
         if detected_pins_override is not None:
             scan.detected_pins = detected_pins_override
         scan.expected_pins = (
-            verification_result.matched_ic.get("pin_count")
+            verification_result.matched_ic.pin_count
             if verification_result.matched_ic
             else None
         )
         scan.match_details = {
-            "part_number_match": verification_checks.get("part_number_match").status
-            if verification_checks.get("part_number_match")
-            else None,
-            "pin_count_match": verification_checks.get("pin_count_match").status
-            if verification_checks.get("pin_count_match")
-            else None,
-            "manufacturer_match": verification_checks.get("manufacturer_match").status
-            if verification_checks.get("manufacturer_match")
-            else None,
+            "part_number_match": checks.part_number_match.status if checks.part_number_match else None,
+            "pin_count_match": checks.pin_count_match.status if checks.pin_count_match else None,
+            "manufacturer_match": checks.manufacturer_match.status if checks.manufacturer_match else None,
         }
         scan.failure_reasons = failure_reasons or None
         scan.verification_checks = verification_checks_dict
@@ -199,14 +195,14 @@ class VerificationService:
                 action_required=ActionRequired.NONE,
                 part_number=part_number,
                 matched_ic=None,
-                verification_checks={
-                    "part_number_match": VerificationCheck(
+                verification_checks=VerificationChecks(
+                    part_number_match=VerificationCheck(
                         status=False,
                         expected=None,
                         actual=part_number,
                         reason=f"Part number '{part_number}' not found in database. Added to sync queue for online lookup."
                     ),
-                },
+                ),
                 confidence_score=0.0,
                 queued_for_sync=True,
                 queued_candidates=queued_candidates,
@@ -319,17 +315,17 @@ class VerificationService:
             mfg_name = ic_spec.manufacturer
 
         # Build matched IC data
-        matched_ic_data = {
-            "part_number": ic_spec.part_number,
-            "manufacturer": ic_spec.manufacturer,
-            "manufacturer_name": mfg_name,
-            "pin_count": ic_spec.pin_count,
-            "package_type": ic_spec.package_type,
-            "description": ic_spec.description,
-            "has_datasheet": ic_spec.has_datasheet if ic_spec.has_datasheet is not None else bool(ic_spec.datasheet_path),
-            "datasheet_path": ic_spec.datasheet_path,
-            "datasheet_url": ic_spec.datasheet_url,
-        }
+        matched_ic_data = MatchedIC(
+            part_number=ic_spec.part_number,
+            manufacturer=ic_spec.manufacturer,
+            manufacturer_name=mfg_name,
+            pin_count=ic_spec.pin_count,
+            package_type=ic_spec.package_type,
+            description=ic_spec.description,
+            has_datasheet=ic_spec.has_datasheet if ic_spec.has_datasheet is not None else bool(ic_spec.datasheet_path),
+            datasheet_path=ic_spec.datasheet_path,
+            datasheet_url=ic_spec.datasheet_url,
+        )
 
         result = ScanVerifyResult(
             scan_id=scan_id,
@@ -338,26 +334,26 @@ class VerificationService:
             action_required=action_required,
             part_number=part_number,
             matched_ic=matched_ic_data,
-            verification_checks={
-                "part_number_match": VerificationCheck(
+            verification_checks=VerificationChecks(
+                part_number_match=VerificationCheck(
                     status=True,
                     expected=ic_spec.part_number,
                     actual=part_number,
                     reason=None,
                 ),
-                "manufacturer_match": VerificationCheck(
+                manufacturer_match=VerificationCheck(
                     status=manufacturer_match,
                     expected=ic_spec.manufacturer,
                     actual=detected_manufacturer or "Not detected",
                     reason=manufacturer_reason,
                 ),
-                "pin_count_match": VerificationCheck(
+                pin_count_match=VerificationCheck(
                     status=pin_match,
                     expected=ic_spec.pin_count,
                     actual=detected_pins,
                     reason=pin_reason,
                 ),
-            },
+            ),
             confidence_score=confidence_score,
             queued_for_sync=False,
             queued_candidates=None,
@@ -0,0 +1,117 @@
+import json
+
+import cv2
+import numpy as np
+import pytest
+
+from services import classification_service
+from services.classification_service import ImageClassifier
+from services.correct import annotate_mask_pins
+from services.correct.classifier import process_folder
+
+
+def draw_package(path, pins_per_side=5, sides=("top", "bottom", "left", "right"), size=400):
+    """Write a synthetic top-down IC: dark body with light pins on the given sides."""
+    img = np.full((size, size, 3), 200, np.uint8)
+    lo, hi = size // 4, 3 * size // 4
+    cv2.rectangle(img, (lo, lo), (hi, hi), (40, 40, 40), -1)
+    step = (hi - lo) // (pins_per_side + 1)
+    for i in range(1, pins_per_side + 1):
+        c = lo + i * step
+        if "top" in sides:
+            cv2.rectangle(img, (c - 7, lo - 40), (c + 7, lo - 2), (235, 235, 235), -1)
+        if "bottom" in sides:
+            cv2.rectangle(img, (c - 7, hi + 2), (c + 7, hi + 40), (235, 235, 235), -1)
+        if "left" in sides:
+            cv2.rectangle(img, (lo - 40, c - 7), (lo - 2, c + 7), (235, 235, 235), -1)
+        if "right" in sides:
+            cv2.rectangle(img, (hi + 2, c - 7), (hi + 40, c + 7), (235, 235, 235), -1)
+    cv2.imwrite(str(path), img)
+    return path
+
+
+def draw_edge_map(path, pins_per_side=5, size=400):
+    """Write a synthetic edge image as run_batch expects: light pins on black along the top and bottom edges."""
+    img = np.zeros((size, size, 3), np.uint8)
+    step = size // (pins_per_side + 1)
+    for i in range(1, pins_per_side + 1):
+        c = i * step
+        cv2.rectangle(img, (c - 7, 10), (c + 7, 48), (255, 255, 255), -1)
+        cv2.rectangle(img, (c - 7, size - 48), (c + 7, size - 10), (255, 255, 255), -1)
+    cv2.imwrite(str(path), img)
+    return path
+
+
+@pytest.fixture
+def package_images(tmp_path):
+    layouts = [("top", "bottom", "left", "right"), ("left", "right"), ("top",), ()]
+    return [draw_package(tmp_path / f"chip_{i}.png", sides=sides) for i, sides in enumerate(layouts)]
+
+
+@pytest.fixture
+def fresh_pool(monkeypatch):
+    monkeypatch.setattr(classification_service, "_pool", None)
+    yield
+    if classification_service._pool is not None:
+        classification_service._pool.shutdown()
+
+
+def test_classify_batch_matches_serial_classification(package_images, fresh_pool):
+    paths = [str(p) for p in package_images]
+    classifier = ImageClassifier()
+
+    batch = classifier.classify_batch(paths)
+
+    assert list(batch) == paths
+    assert batch == {path: classifier.classify_image(path) for path in paths}
+
+
+def test_classifier_instances_share_one_pool(package_images, fresh_pool):
+    paths = [str(p) for p in package_images]
+
+    ImageClassifier().classify_batch(paths)
+    pool = classification_service._pool
+    ImageClassifier().classify_batch(paths)
+
+    assert pool is not None
+    assert classification_service._pool is pool
+
+
+def test_single_image_batch_runs_inline(package_images, fresh_pool):
+    path = str(package_images[0])
+
+    result = ImageClassifier().classify_batch([path])
+
+    assert list(result) == [path]
+    assert classification_service._pool is None
+
+
+def test_process_folder_parallel_matches_serial(package_images, tmp_path):
+    serial_json, parallel_json = tmp_path / "serial.json", tmp_path / "parallel.json"
+    folder = package_images[0].parent
+
+    process_folder(str(folder), str(serial_json), 3, 1.5, 0.3, False, workers=1)
+    process_folder(str(folder), str(parallel_json), 3, 1.5, 0.3, False, workers=2)
+
+    serial = json.loads(serial_json.read_text())
+    assert serial["results"]
+    assert [r["filename"] for r in serial["results"]] == sorted(p.name for p in package_images)
+    assert json.loads(parallel_json.read_text()) == serial
+
+
+def test_run_batch_writes_annotated_images_and_skips_unreadable(tmp_path):
+    edge_maps = [draw_edge_map(tmp_path / f"edges_{n}.png", pins_per_side=n) for n in (3, 5, 7)]
+    unreadable = tmp_path / "broken.png"
+    unreadable.write_bytes(b"not an image")
+    out_dir = tmp_path / "masked"
+
+    counts = annotate_mask_pins.run_batch(edge_maps + [unreadable], out_dir, mask_ratio=0.5)
+
+    assert [counts[path] for path in edge_maps] == [6, 10, 14]
+    assert unreadable not in counts
+    for path in edge_maps:
+        assert (out_dir / f"{path.stem}_masked{path.suffix}").exists()
+        img = cv2.imread(str(path), cv2.IMREAD_COLOR)
+        _, pins = annotate_mask_pins._process(img, 0.5, 300.0, annotate_mask_pins._DEFAULT_MAX_AREA)
+        assert counts[path] == len(pins)
+    assert not (out_dir / "broken_masked.png").exists()
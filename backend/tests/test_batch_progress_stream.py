@@ -0,0 +1,127 @@
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+# The batch endpoints import the model router, which needs torch
+pytest.importorskip("torch")
+
+from fastapi import HTTPException
+
+from api.endpoints import batch
+
+
+def make_result(name):
+    return {
+        "image_path": f"/tmp/batch/{name}",
+        "classification": {"model_type": "light_vision"},
+        "result": {"specs": {"part_number": "LM324N"}},
+        "processing_time": 0.5,
+    }
+
+
+def make_job(status="processing", results=None, image_paths=()):
+    return {
+        "status": status,
+        "total_images": len(image_paths) or len(results or []),
+        "processed_images": len(results or []),
+        "results": list(results or []),
+        "start_time": datetime.now(),
+        "image_paths": list(image_paths),
+        "job_dir": None,
+        "listeners": [],
+    }
+
+
+@pytest.fixture
+def jobs(monkeypatch):
+    jobs = {}
+    monkeypatch.setattr(batch, "batch_jobs", jobs)
+    return jobs
+
+
+class SteppedRouter:
+    """ModelRouter stand-in that yields one result each time `step` is set."""
+
+    def __init__(self):
+        self.step = asyncio.Event()
+
+    async def iter_batch(self, image_paths):
+        for path in image_paths:
+            await self.step.wait()
+            self.step.clear()
+            yield make_result(path.rsplit("/", 1)[-1])
+
+
+async def read_line(body):
+    return json.loads(await asyncio.wait_for(body.__anext__(), timeout=1))
+
+
+@pytest.mark.anyio
+async def test_unknown_job_is_404(jobs):
+    with pytest.raises(HTTPException) as exc:
+        await batch.stream_batch_progress("missing")
+    assert exc.value.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_completed_job_replays_results_and_ends(jobs):
+    jobs["done"] = make_job("completed", [make_result("a.png"), make_result("b.png")])
+
+    response = await batch.stream_batch_progress("done")
+    lines = [json.loads(chunk) async for chunk in response.body_iterator]
+
+    assert response.media_type == "application/x-ndjson"
+    assert [line["image_path"] for line in lines] == ["/tmp/batch/a.png", "/tmp/batch/b.png"]
+    assert lines[0]["processing_time"] == 0.5
+    assert jobs["done"]["listeners"] == []
+
+
+@pytest.mark.anyio
+async def test_running_job_streams_each_result_as_it_finishes(jobs, monkeypatch):
+    router = SteppedRouter()
+    monkeypatch.setattr(batch, "ModelRouter", lambda: router)
+    jobs["live"] = make_job(
+        results=[make_result("already.png")],
+        image_paths=["/jobs/live/one.png", "/jobs/live/two.png"],
+    )
+
+    body = (await batch.stream_batch_progress("live")).body_iterator
+    assert (await read_line(body))["image_path"] == "/tmp/batch/already.png"
+
+    worker = asyncio.create_task(batch.process_batch_job("live"))
+
+    router.step.set()
+    assert (await read_line(body))["image_path"] == "live/one.png"
+    assert jobs["live"]["status"] == "processing"
+
+    router.step.set()
+    assert (await read_line(body))["image_path"] == "live/two.png"
+
+    await worker
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(body.__anext__(), timeout=1)
+    assert jobs["live"]["status"] == "completed"
+    assert jobs["live"]["processed_images"] == 3
+    assert jobs["live"]["listeners"] == []
+
+
+@pytest.mark.anyio
+async def test_failed_job_ends_open_streams(jobs, monkeypatch):
+    class BrokenRouter:
+        async def iter_batch(self, image_paths):
+            raise RuntimeError("model crashed")
+            yield
+
+    monkeypatch.setattr(batch, "ModelRouter", BrokenRouter)
+    jobs["bad"] = make_job(image_paths=["/jobs/bad/one.png"])
+
+    body = (await batch.stream_batch_progress("bad")).body_iterator
+    pending = asyncio.ensure_future(body.__anext__())
+    await batch.process_batch_job("bad")
+
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(pending, timeout=1)
+    assert jobs["bad"]["status"] == "failed"
+    assert jobs["bad"]["error"] == "model crashed"
@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from schemas.common import SyncStatus
+from services.dashboard_service import DashboardService, STATS_CACHE_TTL_SECONDS
+
+
+class FakeResult:
+    def __init__(self, row):
+        self._row = row
+
+    def mappings(self):
+        return self
+
+    def one(self):
+        return self._row
+
+
+class FakeSession:
+    """Stands in for AsyncSession: returns one aggregate row and records the calls."""
+
+    def __init__(self, row):
+        self.row = row
+        self.calls = []
+
+    async def execute(self, statement, params=None):
+        self.calls.append(params)
+        return FakeResult(self.row)
+
+
+def make_row(**overrides):
+    row = {
+        "total_scans": 40,
+        "scans_today": 3,
+        "scans_this_week": 12,
+        "pass_count": 30,
+        "fail_count": 6,
+        "unknown_count": 2,
+        "counterfeit_count": 2,
+        "queue_size": 5,
+        "fake_registry_size": 1,
+        "database_ic_count": 900,
+        "last_sync_at": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "last_sync_status": "COMPLETED",
+        # json_agg hands timestamps back as strings
+        "recent_counterfeits": [
+            {"part_number": "LM555", "scanned_at": "2025-01-02T10:00:00+00:00"},
+            {"part_number": "NE555", "scanned_at": "2025-01-01T09:00:00+00:00"},
+        ],
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture(autouse=True)
+def clear_stats_cache():
+    DashboardService._cached_stats = None
+    DashboardService._cached_at = 0.0
+    yield
+    DashboardService._cached_stats = None
+    DashboardService._cached_at = 0.0
+
+
+@pytest.mark.anyio
+async def test_query_stats_maps_aggregate_row():
+    session = FakeSession(make_row())
+
+    stats = await DashboardService._query_stats(session)
+
+    assert stats.total_scans == 40
+    assert stats.scans_today == 3
+    assert stats.scans_this_week == 12
+    assert (stats.pass_count, stats.fail_count, stats.unknown_count, stats.counterfeit_count) == (30, 6, 2, 2)
+    assert stats.pass_rate_percentage == 75.0
+    assert (stats.queue_size, stats.fake_registry_size, stats.database_ic_count) == (5, 1, 900)
+    assert stats.last_sync_status == SyncStatus.COMPLETED
+    assert stats.last_sync_at == datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert [c.part_number for c in stats.recent_counterfeits] == ["LM555", "NE555"]
+    assert stats.recent_counterfeits[0].scanned_at == datetime(2025, 1, 2, 10, tzinfo=timezone.utc)
+
+
+@pytest.mark.anyio
+async def test_query_stats_handles_empty_tables():
+    session = FakeSession(make_row(
+        total_scans=0, scans_today=None, scans_this_week=None, pass_count=None,
+        fail_count=None, unknown_count=None, counterfeit_count=None,
+        queue_size=None, fake_registry_size=None, database_ic_count=None,
+        last_sync_at=None, last_sync_status=None, recent_counterfeits=None,
+    ))
+
+    stats = await DashboardService._query_stats(session)
+
+    assert stats.total_scans == 0
+    assert stats.pass_rate_percentage == 0.0
+    assert stats.counterfeit_count == 0
+    assert stats.last_sync_at is None
+    assert stats.last_sync_status is None
+    assert stats.recent_counterfeits == []
+
+
+@pytest.mark.anyio
+async def test_query_stats_passes_utc_day_and_week_bounds():
+    session = FakeSession(make_row())
+
+    await DashboardService._query_stats(session)
+
+    params = session.calls[0]
+    today_start = params["today_start"]
+    assert today_start.tzinfo == timezone.utc
+    assert (today_start.hour, today_start.minute, today_start.second) == (0, 0, 0)
+    assert today_start.date() == datetime.now(timezone.utc).date()
+    assert params["week_start"] == today_start - timedelta(days=7)
+
+
+@pytest.mark.anyio
+async def test_get_stats_serves_cached_result_within_ttl():
+    session = FakeSession(make_row())
+
+    first = await DashboardService.get_stats(session)
+    second = await DashboardService.get_stats(session)
+
+    assert second is first
+    assert len(session.calls) == 1
+
+
+@pytest.mark.anyio
+async def test_get_stats_requeries_after_ttl():
+    session = FakeSession(make_row())
+    await DashboardService.get_stats(session)
+
+    DashboardService._cached_at -= STATS_CACHE_TTL_SECONDS + 1
+    session.row = make_row(total_scans=41, pass_count=31)
+    stats = await DashboardService.get_stats(session)
+
+    assert len(session.calls) == 2
+    assert stats.total_scans == 41
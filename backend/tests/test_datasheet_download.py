@@ -0,0 +1,235 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from services import datasheet_storage
+from services.datasheet.service import DatasheetService
+from services.datasheet_storage import (
+    atomic_write,
+    download_pdf_async,
+    get_datasheet_filename,
+    get_storage_folder,
+)
+
+PDF_BYTES = b"%PDF-1.4\n" + b"x" * 1000 + b"\n%%EOF\n"
+URL = "https://datasheets.example.com/lm555.pdf"
+
+
+@pytest.fixture
+def storage_folder(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATASHEET_ROOT", str(tmp_path))
+    # No backoff sleeps, and a fresh per-host throttle for each test
+    monkeypatch.setattr(datasheet_storage, "RETRY_BACKOFF_BASE_SECONDS", 0)
+    monkeypatch.setattr(datasheet_storage, "_host_throttles", {})
+    return get_storage_folder()
+
+
+@pytest.fixture
+def storage(storage_folder, monkeypatch):
+    # No network: skip preview-page / redirect resolution
+    async def no_resolution(url):
+        return url
+
+    monkeypatch.setattr(datasheet_storage, "resolve_url_async", no_resolution)
+    return storage_folder
+
+
+def use_transport(monkeypatch, handler):
+    """Route the shared download client through an in-process handler; returns the request log."""
+    requests = []
+
+    def record(request):
+        requests.append(request)
+        return handler(request, len(requests))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+    monkeypatch.setattr(datasheet_storage, "_http_client", client)
+    return requests
+
+
+def pdf_response(**headers):
+    return httpx.Response(200, content=PDF_BYTES, headers={"content-type": "application/pdf", **headers})
+
+
+def stored_files(folder):
+    return sorted(p.name for p in folder.iterdir())
+
+
+@pytest.mark.anyio
+async def test_retries_server_error_then_saves_pdf(storage, monkeypatch):
+    requests = use_transport(
+        monkeypatch,
+        lambda request, n: httpx.Response(503) if n == 1 else pdf_response(etag='"v1"'),
+    )
+
+    filename, size = await download_pdf_async(URL, "LM555", "TI")
+
+    assert len(requests) == 2
+    assert filename == get_datasheet_filename("LM555", "TI")
+    assert size == len(PDF_BYTES)
+    assert (storage / filename).read_bytes() == PDF_BYTES
+    assert json.loads((storage / f"{filename}.meta").read_text())["etag"] == '"v1"'
+
+
+@pytest.mark.anyio
+async def test_retries_network_error(storage, monkeypatch):
+    def handler(request, n):
+        if n == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return pdf_response()
+
+    requests = use_transport(monkeypatch, handler)
+
+    filename, size = await download_pdf_async(URL, "LM555", "TI")
+
+    assert len(requests) == 2
+    assert size == len(PDF_BYTES)
+    # No validators in the response, so no sidecar is kept
+    assert stored_files(storage) == [filename]
+
+
+@pytest.mark.anyio
+async def test_gives_up_after_max_retries(storage, monkeypatch):
+    requests = use_transport(monkeypatch, lambda request, n: httpx.Response(502))
+
+    with pytest.raises(Exception, match="HTTP 502"):
+        await download_pdf_async(URL, "LM555", "TI", max_retries=3)
+
+    assert len(requests) == 3
+    assert stored_files(storage) == []
+
+
+@pytest.mark.anyio
+async def test_not_found_is_not_retried(storage, monkeypatch):
+    requests = use_transport(monkeypatch, lambda request, n: httpx.Response(404))
+
+    with pytest.raises(Exception, match="404"):
+        await download_pdf_async(URL, "LM555", "TI")
+
+    assert len(requests) == 1
+    assert stored_files(storage) == []
+
+
+@pytest.mark.anyio
+async def test_first_download_sends_no_validators(storage, monkeypatch):
+    requests = use_transport(monkeypatch, lambda request, n: pdf_response())
+
+    await download_pdf_async(URL, "LM555", "TI")
+
+    assert "if-none-match" not in requests[0].headers
+    assert "if-modified-since" not in requests[0].headers
+
+
+@pytest.mark.anyio
+async def test_not_modified_keeps_stored_pdf(storage, monkeypatch):
+    filename = get_datasheet_filename("LM555", "TI")
+    (storage / filename).write_bytes(PDF_BYTES)
+    (storage / f"{filename}.meta").write_text(json.dumps({
+        "etag": '"v1"',
+        "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }))
+    requests = use_transport(monkeypatch, lambda request, n: httpx.Response(304))
+
+    result = await download_pdf_async(URL, "LM555", "TI")
+
+    assert result == (filename, len(PDF_BYTES))
+    assert len(requests) == 1
+    assert requests[0].headers["if-none-match"] == '"v1"'
+    assert requests[0].headers["if-modified-since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    assert (storage / filename).read_bytes() == PDF_BYTES
+
+
+@pytest.mark.anyio
+async def test_service_reuses_stored_pdf_without_a_request(storage, monkeypatch):
+    filename = get_datasheet_filename("LM555", "TI")
+    (storage / filename).write_bytes(PDF_BYTES)
+    requests = use_transport(monkeypatch, lambda request, n: pdf_response())
+
+    result = await DatasheetService()._download_single("LM555", "TI")
+
+    assert requests == []
+    assert (result["file_path"], result["file_size_bytes"]) == (filename, len(PDF_BYTES))
+
+
+@pytest.mark.anyio
+async def test_service_revalidates_stored_pdf_with_conditional_get(storage, monkeypatch):
+    filename = get_datasheet_filename("LM555", "TI")
+    (storage / filename).write_bytes(PDF_BYTES)
+    (storage / f"{filename}.meta").write_text(json.dumps({"etag": '"v1"'}))
+    requests = use_transport(monkeypatch, lambda request, n: httpx.Response(304))
+
+    result = await DatasheetService()._download_single("LM555", "TI", revalidate=True)
+
+    assert len(requests) == 1
+    assert requests[0].headers["if-none-match"] == '"v1"'
+    assert (result["file_path"], result["file_size_bytes"]) == (filename, len(PDF_BYTES))
+    assert (storage / filename).read_bytes() == PDF_BYTES
+
+
+def use_blocking_resolution(monkeypatch, delay=0.2):
+    """Replace the requests calls made by URL resolution with slow blocking stand-ins."""
+    def slow_get(url, **kwargs):
+        time.sleep(delay)
+        return SimpleNamespace(status_code=200, headers={"content-type": "application/pdf"})
+
+    def slow_head(url, **kwargs):
+        time.sleep(delay)
+        return SimpleNamespace(url=url)
+
+    monkeypatch.setattr(datasheet_storage.requests, "get", slow_get)
+    monkeypatch.setattr(datasheet_storage.requests, "head", slow_head)
+
+
+@pytest.mark.anyio
+async def test_url_resolution_does_not_block_concurrent_downloads(storage_folder, monkeypatch):
+    # URL resolution runs for real; only its requests calls are stubbed
+    use_blocking_resolution(monkeypatch)
+    use_transport(monkeypatch, lambda request, n: pdf_response())
+    parts = [f"LM55{i}" for i in range(4)]
+
+    start = time.monotonic()
+    results = await asyncio.gather(*(download_pdf_async(URL, part, "TI") for part in parts))
+    elapsed = time.monotonic() - start
+
+    assert [name for name, _ in results] == [get_datasheet_filename(part, "TI") for part in parts]
+    # Serially the four resolutions would take 4 x 0.4 s
+    assert elapsed < 1.0
+
+
+@pytest.mark.anyio
+async def test_url_resolution_requests_take_throttle_credits(storage_folder, monkeypatch):
+    use_blocking_resolution(monkeypatch, delay=0)
+    use_transport(monkeypatch, lambda request, n: pdf_response())
+
+    await download_pdf_async(URL, "LM555", "TI")
+
+    # Preview-page GET, redirect HEAD and the download itself
+    assert len(datasheet_storage.get_host_throttle(URL)._sent) == 3
+
+
+def test_atomic_write_replaces_file_on_success(tmp_path):
+    target = tmp_path / "part.pdf"
+    target.write_bytes(b"old")
+
+    with atomic_write(target) as f:
+        f.write(b"new")
+
+    assert target.read_bytes() == b"new"
+    assert stored_files(tmp_path) == ["part.pdf"]
+
+
+def test_atomic_write_keeps_previous_file_on_failure(tmp_path):
+    target = tmp_path / "part.pdf"
+    target.write_bytes(b"old")
+
+    with pytest.raises(RuntimeError):
+        with atomic_write(target) as f:
+            f.write(b"partial")
+            raise RuntimeError("connection dropped")
+
+    assert target.read_bytes() == b"old"
+    assert stored_files(tmp_path) == ["part.pdf"]
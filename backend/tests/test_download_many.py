@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from services.datasheet.service import DatasheetService
+
+
+class CountingDownloads:
+    """Stands in for download_datasheet: tracks how many calls are in flight at once."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, part_number, manufacturer_code=None, revalidate=False):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            # Finish in reverse order so result ordering can't come from timing
+            await asyncio.sleep(0.01 * (10 - int(part_number[-1])))
+            if part_number in self.failing:
+                raise ValueError(f"no datasheet for {part_number}")
+            return {"part_number": part_number, "manufacturer": manufacturer_code}
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATASHEET_ROOT", str(tmp_path))
+    return DatasheetService()
+
+
+@pytest.mark.anyio
+async def test_download_many_keeps_input_order(service, monkeypatch):
+    downloads = CountingDownloads()
+    monkeypatch.setattr(service, "download_datasheet", downloads)
+    items = [(f"PART{i}", "TI" if i % 2 else None) for i in range(6)]
+
+    results = await service.download_many(items)
+
+    assert results == [{"part_number": pn, "manufacturer": mfr} for pn, mfr in items]
+
+
+@pytest.mark.anyio
+async def test_download_many_bounds_concurrency(service, monkeypatch):
+    downloads = CountingDownloads()
+    monkeypatch.setattr(service, "download_datasheet", downloads)
+
+    await service.download_many([(f"PART{i}", None) for i in range(8)], concurrency=3)
+
+    assert downloads.peak == 3
+    assert downloads.in_flight == 0
+
+
+@pytest.mark.anyio
+async def test_download_many_returns_failures_in_place(service, monkeypatch):
+    downloads = CountingDownloads(failing={"PART1"})
+    monkeypatch.setattr(service, "download_datasheet", downloads)
+
+    results = await service.download_many([("PART0", None), ("PART1", None), ("PART2", None)])
+
+    assert results[0]["part_number"] == "PART0"
+    assert isinstance(results[1], ValueError)
+    assert str(results[1]) == "no datasheet for PART1"
+    assert results[2]["part_number"] == "PART2"
@@ -0,0 +1,83 @@
+import pytest
+
+# The endpoints package imports the model router, which needs torch
+pytest.importorskip("torch")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.endpoints import images
+
+PNG_BYTES = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082"
+)
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv("MEDIA_ROOT", str(tmp_path))
+    monkeypatch.setattr(images, "_upload_cache", type(images._upload_cache)())
+
+    app = FastAPI()
+    app.include_router(images.router)
+    return TestClient(app)
+
+
+@pytest.fixture
+def pipeline_calls(monkeypatch):
+    calls = []
+    process = images.preprocessing_pipeline.process
+
+    async def counting_process(file_path, options=None):
+        calls.append(file_path)
+        return await process(file_path, options=options)
+
+    monkeypatch.setattr(images.preprocessing_pipeline, "process", counting_process)
+    return calls
+
+
+def upload(client, content=PNG_BYTES, filename="chip.png", **options):
+    return client.post(
+        "/images/upload",
+        files={"file": (filename, content, "image/png")},
+        data={key: str(value).lower() for key, value in options.items()},
+    )
+
+
+def test_identical_upload_reuses_first_result(client, pipeline_calls, tmp_path):
+    first = upload(client)
+    second = upload(client, filename="same-bytes-other-name.png")
+
+    assert first.status_code == second.status_code == 201
+    assert second.json() == first.json()
+    assert len(pipeline_calls) == 1
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_different_options_are_processed_separately(client, pipeline_calls):
+    first = upload(client, enhance_contrast=False)
+    second = upload(client, enhance_contrast=True)
+
+    assert second.json()["image_id"] != first.json()["image_id"]
+    assert len(pipeline_calls) == 2
+
+
+def test_different_content_is_processed_separately(client, pipeline_calls):
+    first = upload(client)
+    second = upload(client, content=PNG_BYTES + b"\x00")
+
+    assert second.json()["image_id"] != first.json()["image_id"]
+    assert len(pipeline_calls) == 2
+
+
+def test_removed_file_is_not_served_from_cache(client, pipeline_calls, tmp_path):
+    first = upload(client)
+    for stored in tmp_path.iterdir():
+        stored.unlink()
+
+    second = upload(client)
+
+    assert second.status_code == 201
+    assert second.json()["image_id"] != first.json()["image_id"]
+    assert len(pipeline_calls) == 2
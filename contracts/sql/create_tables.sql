@@ -87,6 +87,7 @@ CREATE TABLE IF NOT EXISTS scan_history (
 CREATE INDEX IF NOT EXISTS idx_scan_history_scan_id ON scan_history(scan_id);
 CREATE INDEX IF NOT EXISTS idx_scan_history_status ON scan_history(status);
 CREATE INDEX IF NOT EXISTS idx_scan_history_scanned_at ON scan_history(scanned_at);
+CREATE INDEX IF NOT EXISTS idx_scan_history_status_scanned_at ON scan_history(status, scanned_at);
 CREATE INDEX IF NOT EXISTS idx_scan_history_part_number ON scan_history(part_number_verified);
 CREATE INDEX IF NOT EXISTS idx_scan_history_part_number_detected ON scan_history(part_number_detected);
 CREATE INDEX IF NOT EXISTS idx_scan_history_batch_id ON scan_history(batch_id);
@@ -179,6 +179,7 @@ export interface ScanDetails extends ScanResult {
   operator_note?: string | null
   verification_checks?: Record<string, any> | null
   failure_reasons?: string[] | null
+  ic_specification_url?: string | null
 }
 
 // ============================================================